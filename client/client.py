@@ -41,6 +41,9 @@ class GameClient:
             get_queue_info_callback=self._on_get_queue_info
         )
 
+        # Traiter les messages du serveur dans le thread de Tk
+        self.network.set_marshaller(lambda callback, *args: self.gui.root.after(0, callback, *args))
+
         # Connecter au serveur
         connection_thread = threading.Thread(target=self._connect_to_server)
         connection_thread.daemon = True
@@ -49,15 +52,29 @@ class GameClient:
         # Lancer l'interface graphique
         self.gui.run()
 
+        # L'interface est fermée : ne plus lui transmettre de messages
+        self.network.set_marshaller(None)
+        self.network.message_callback = None
+
         # Déconnexion
         if self.network.connected:
             self.network.disconnect()
 
     def _connect_to_server(self):
-        """Connecte au serveur."""
+        """Connecte au serveur (exécutée dans un thread séparé)."""
         connected = self.network.connect()
 
-        # Mettre à jour l'interface
+        # Mettre à jour l'interface dans le thread de Tk
+        if self.gui:
+            self.gui.root.after(0, self._on_connection_result, connected)
+
+    def _on_connection_result(self, connected):
+        """
+        Applique le résultat de la connexion dans le thread de Tk.
+
+        Args:
+            connected (bool): True si la connexion a réussi
+        """
         if self.gui:
             self.gui.set_connected(connected)
 
@@ -181,16 +198,12 @@ class GameClient:
         Gère un message MOVE_PLAYED.
 
         Args:
-            data (dict): Données du message
+            data (MovePlayed): Données du message
         """
-        match_id = data.get("match_id")
-        board = data.get("board")
-        your_turn = data.get("your_turn")
-
-        if match_id == self.match_id and board is not None:
+        if data.match_id == self.match_id:
             # Mettre à jour la partie dans l'interface
             if self.gui:
-                self.gui.update_game(board, your_turn)
+                self.gui.update_game(data.board, data.your_turn)
 
     def _handle_game_end(self, data):
         """
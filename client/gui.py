@@ -1,14 +1,79 @@
 """
 Interface graphique améliorée pour le client Puissance 4.
 """
+import array
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox
 import threading
 import time
 from datetime import datetime
 import math
 
 
+# Table de sinus précalculée (256 entrées sur un tour complet) pour les animations
+_SIN_TABLE_SIZE = 256
+_SIN_SCALE = _SIN_TABLE_SIZE / (2 * math.pi)
+_SIN = tuple(math.sin(i * 2 * math.pi / _SIN_TABLE_SIZE) for i in range(_SIN_TABLE_SIZE))
+
+
+def _fast_sin(theta):
+    """
+    Approxime sin(theta) à l'aide de la table précalculée.
+
+    Args:
+        theta (float): Angle en radians
+
+    Returns:
+        float: Valeur approchée du sinus
+    """
+    return _SIN[int(theta * _SIN_SCALE) & (_SIN_TABLE_SIZE - 1)]
+
+
+def _enumerate_lines():
+    """
+    Énumère tous les alignements de 4 cases du plateau 6x7.
+
+    Yields:
+        tuple: Indices des 4 cases dans le plateau aplati (ligne * 7 + colonne)
+    """
+    # Horizontal
+    for row in range(6):
+        for col in range(4):
+            yield tuple(row * 7 + col + i for i in range(4))
+
+    # Vertical
+    for row in range(3):
+        for col in range(7):
+            yield tuple((row + i) * 7 + col for i in range(4))
+
+    # Diagonale (bas gauche vers haut droit)
+    for row in range(3, 6):
+        for col in range(4):
+            yield tuple((row - i) * 7 + col + i for i in range(4))
+
+    # Diagonale (haut gauche vers bas droit)
+    for row in range(3):
+        for col in range(4):
+            yield tuple((row + i) * 7 + col + i for i in range(4))
+
+
+# Les 69 alignements gagnants possibles, calculés une seule fois
+WIN_LINES = tuple(_enumerate_lines())
+
+
+def _flatten_board(board):
+    """
+    Met le plateau reçu du serveur à plat.
+
+    Args:
+        board (list): Plateau sous forme de 6 lignes de 7 cases
+
+    Returns:
+        array.array: Les 42 cases, la case (row, col) à l'indice row * 7 + col
+    """
+    return array.array('b', [cell for row in board for cell in row])
+
+
 class ConnectFourGUI:
     """Interface graphique pour le jeu Puissance 4."""
 
@@ -32,7 +97,9 @@ class ConnectFourGUI:
         self.match_id = None
         self.player_number = None
         self.current_player = None
-        self.board = [[0 for _ in range(7)] for _ in range(6)]
+        self.board = array.array('b', bytes(42))  # Plateau à plat, case row * 7 + col
+        self._bits1 = 0  # Cases du joueur 1, bit row * 7 + col
+        self._bits2 = 0  # Cases du joueur 2
         self.is_game_over = False
         self.winner = None
         self.winning_positions = []  # Positions des pièces gagnantes
@@ -63,6 +130,15 @@ class ConnectFourGUI:
         self.victory_animation_step = 0
         self.victory_animation_active = False
 
+        # Mise à jour de l'écran de jeu planifiée (fusion des mises à jour rapprochées)
+        self._draw_scheduled = False
+        self._board_dirty = True  # Le plateau doit être redessiné à la prochaine mise à jour
+
+        # Dernières valeurs affichées dans les libellés de l'écran de jeu
+        self._last_status = None
+        self._last_back_visible = None
+        self._last_player_texts = None
+
         # Créer la fenêtre principale
         self.root = tk.Tk()
         self.root.title("Puissance 4 - Matchmaking")
@@ -162,6 +238,16 @@ class ConnectFourGUI:
         self.piece_radius = 30
         self.highlight_column = None
 
+        # Sprites pré-rendus des cellules et des pièces {clé: PhotoImage}
+        self._sprites = {}
+
+        # Position du plateau dans son canvas, recalculée par l'événement <Configure>
+        self._offset_x = 0
+        self._offset_y = 0
+        self._centers = [[(0, 0)] * 7 for _ in range(6)]  # Centre de chaque case
+        self._column_boxes = [(0, 0, 0, 0)] * 7  # Rectangle de surbrillance de chaque colonne
+        self._drop_y = 0  # Ordonnée des pièces au-dessus du plateau
+
     def _create_menu_screen(self):
         """Crée l'écran du menu principal."""
         # Frame du menu
@@ -308,6 +394,7 @@ class ConnectFourGUI:
 
         self.board_canvas = tk.Canvas(self.board_frame, bg=self.colors['bg'], highlightthickness=0)
         self.board_canvas.pack(fill=tk.BOTH, expand=True)
+        self._init_board_canvas()
 
         # Bind des événements
         self.board_canvas.bind("<Motion>", self._on_mouse_move)
@@ -410,61 +497,69 @@ class ConnectFourGUI:
 
     def _update_game_screen(self):
         """Met à jour l'écran de jeu."""
+        self._update_status_labels()
+
+        # Démarrer l'animation de victoire si le jeu vient de se terminer
+        if (self.match_id is None and self.is_game_over and not self.victory_animation_active
+                and self.winning_positions):
+            self.victory_animation_active = True
+            self.victory_animation_step = 0
+            self._animate_victory()
+
+        # Redessiner le plateau seulement si l'état de la partie a changé
+        if self._board_dirty:
+            self._board_dirty = False
+            self._draw_board()
+
+    def _update_status_labels(self):
+        """Met à jour le statut de la partie et les noms des joueurs (seulement ce qui a changé)."""
         if self.match_id is None:
             # Pas de match en cours
             if self.is_game_over:
-                # Match terminé
+                # Match terminé, couleur selon le résultat
                 if self.winner == 0:
-                    status_text = "Match nul !"
+                    status = ("Match nul !", self.colors['text'])
                 elif self.winner == self.player_number:
-                    status_text = "Vous avez gagné !"
+                    status = ("Vous avez gagné !", self.colors['green'])
                 else:
-                    status_text = "Vous avez perdu !"
-
-                # Couleur selon le résultat
-                if self.winner == 0:
-                    self.game_status_label.config(foreground=self.colors['text'])
-                elif self.winner == self.player_number:
-                    self.game_status_label.config(foreground=self.colors['green'])
-                else:
-                    self.game_status_label.config(foreground=self.colors['red'])
+                    status = ("Vous avez perdu !", self.colors['red'])
 
                 # Afficher le bouton de retour au menu
-                self.back_to_menu_button.pack(side=tk.RIGHT)
-
-                # Démarrer l'animation de victoire si le jeu vient de se terminer
-                if not self.victory_animation_active and self.winning_positions:
-                    self.victory_animation_active = True
-                    self.victory_animation_step = 0
-                    self._animate_victory()
+                back_visible = True
             else:
                 # En attente d'un match
-                status_text = "En attente d'un match"
-                self.game_status_label.config(foreground=self.colors['text'])
-                self.back_to_menu_button.pack_forget()
+                status = ("En attente d'un match", self.colors['text'])
+                back_visible = False
         else:
             # Match en cours
             if self.current_player == self.player_number:
-                status_text = "C'est votre tour"
-                self.game_status_label.config(foreground=self.colors['green'])
+                status = ("C'est votre tour", self.colors['green'])
             else:
-                status_text = f"C'est le tour de {self.opponent_name}"
-                self.game_status_label.config(foreground=self.colors['text'])
+                status = (f"C'est le tour de {self.opponent_name}", self.colors['text'])
 
             # Cacher le bouton de retour pendant une partie
-            self.back_to_menu_button.pack_forget()
-
-        self.game_status_label.config(text=status_text)
+            back_visible = False
 
-        # Mettre à jour les informations des joueurs
-        player1_text = f"Joueur 1: {self.player_name if self.player_number == 1 else self.opponent_name}"
-        player2_text = f"Joueur 2: {self.player_name if self.player_number == 2 else self.opponent_name}"
+        if status != self._last_status:
+            self._last_status = status
+            self.game_status_label.config(text=status[0], foreground=status[1])
 
-        self.player1_label.config(text=player1_text, foreground=self.colors['player1'])
-        self.player2_label.config(text=player2_text, foreground=self.colors['player2'])
+        if back_visible != self._last_back_visible:
+            self._last_back_visible = back_visible
+            if back_visible:
+                self.back_to_menu_button.pack(side=tk.RIGHT)
+            else:
+                self.back_to_menu_button.pack_forget()
 
-        # Dessiner le plateau
-        self._draw_board()
+        # Mettre à jour les informations des joueurs
+        player_texts = (
+            f"Joueur 1: {self.player_name if self.player_number == 1 else self.opponent_name}",
+            f"Joueur 2: {self.player_name if self.player_number == 2 else self.opponent_name}"
+        )
+        if player_texts != self._last_player_texts:
+            self._last_player_texts = player_texts
+            self.player1_label.config(text=player_texts[0], foreground=self.colors['player1'])
+            self.player2_label.config(text=player_texts[1], foreground=self.colors['player2'])
 
     def _animate_victory(self):
         """Anime les pièces gagnantes."""
@@ -627,199 +722,391 @@ class ConnectFourGUI:
         # Retourner la couleur au format hexadécimal
         return f"#{r:02x}{g:02x}{b:02x}"
 
-    def _draw_board(self):
-        """Dessine le plateau de jeu."""
-        # Effacer le canvas
-        self.board_canvas.delete("all")
-
-        # Calculer les dimensions du plateau
-        board_width = 7 * self.cell_size
-        board_height = 6 * self.cell_size
-
-        # Centrer le plateau dans le canvas
-        canvas_width = self.board_canvas.winfo_width()
-        canvas_height = self.board_canvas.winfo_height()
+    def _init_board_canvas(self):
+        """Crée une seule fois tous les éléments du plateau (décor, cellules, pièces, surbrillance, fantôme)."""
+        self._static_item_ids = []
+        self._corner_arc_ids = []
 
-        offset_x = (canvas_width - board_width) // 2
-        offset_y = (canvas_height - board_height) // 2
+        # Ombre du plateau
+        self._static_item_ids.append(self.board_canvas.create_rectangle(
+            0, 0, 0, 0, fill="#151521", outline="", width=0, tags="board_static"
+        ))
 
-        # Dessiner un effet d'ombre pour le plateau
-        shadow_offset = 5
-        self.board_canvas.create_rectangle(
-            offset_x - 10 + shadow_offset, offset_y - 10 + shadow_offset,
-            offset_x + board_width + 10 + shadow_offset, offset_y + board_height + 10 + shadow_offset,
-            fill="#151521", outline="", width=0
-        )
-
-        # Dessiner le fond du plateau avec un effet de dégradé
+        # Fond du plateau avec un effet de dégradé
         for i in range(10):
             factor = i / 10
             color = self._blend_colors(self.colors['board'], "#23253D", factor)
-            self.board_canvas.create_rectangle(
-                offset_x - 10 + i, offset_y - 10 + i,
-                offset_x + board_width + 10 - i, offset_y + board_height + 10 - i,
-                fill=color, outline=self.colors['board_border'], width=1
-            )
-
-        # Dessiner une bordure extérieure brillante
-        self.board_canvas.create_rectangle(
-            offset_x - 10, offset_y - 10,
-            offset_x + board_width + 10, offset_y + board_height + 10,
-            fill="", outline=self.colors['accent'], width=2
+            self._static_item_ids.append(self.board_canvas.create_rectangle(
+                0, 0, 0, 0, fill=color, outline=self.colors['board_border'], width=1, tags="board_static"
+            ))
+
+        # Bordure extérieure brillante
+        self._static_item_ids.append(self.board_canvas.create_rectangle(
+            0, 0, 0, 0, fill="", outline=self.colors['accent'], width=2, tags="board_static"
+        ))
+
+        # Décorations des coins arrondis
+        for start in (90, 0, 180, 270):
+            self._corner_arc_ids.append(self.board_canvas.create_arc(
+                0, 0, 0, 0, start=start, extent=90, outline=self.colors['accent'], style="arc", width=2,
+                tags="board_static"
+            ))
+
+        # Cellules vides (fixes) puis emplacements des pièces (cachés tant que la case est vide)
+        cell_sprite = self._get_cell_sprite(self.colors['empty'])
+        self._cell_ids = [[self.board_canvas.create_image(0, 0, image=cell_sprite, tags="board_static")
+                           for _ in range(7)] for _ in range(6)]
+        self._piece_ids = [[self.board_canvas.create_image(0, 0, state='hidden')
+                            for _ in range(7)] for _ in range(6)]
+
+        # Colonne en surbrillance et pièce fantôme, affichées uniquement au survol
+        self._highlight_id = self.board_canvas.create_rectangle(
+            0, 0, 0, 0, fill=self.colors['highlight_col'], stipple="gray50", outline="", state='hidden'
         )
+        self._ghost_id = self.board_canvas.create_image(0, 0, state='hidden')
+
+        # Pièce en cours de chute
+        self._falling_id = self.board_canvas.create_image(0, 0, state='hidden')
+
+        # État affiché, pour ne mettre à jour que ce qui a changé
+        self._prev_bits1 = 0
+        self._prev_bits2 = 0
+        self._prev_winning = set()
+        self._prev_highlight = None
+        self._highlight_shown = False
+        self._ghost_player = None
+        self._victory_drawn = False
+        self._redraw_pending = False
 
-        # Dessiner des décorations pour le plateau (coins arrondis)
+        # Mémoriser la taille du canvas à chaque changement de taille
+        self.board_canvas.bind("<Configure>", self._on_canvas_resize)
+
+    def _on_canvas_resize(self, event):
+        """
+        Recalcule la position du plateau centré dans le canvas et replace ses éléments.
+
+        Args:
+            event: Événement <Configure> du canvas
+        """
+        self._offset_x = (event.width - 7 * self.cell_size) // 2
+        self._offset_y = (event.height - 6 * self.cell_size) // 2
+        self._recompute_centers()
+        self._relayout_board()
+
+    def _recompute_centers(self):
+        """Précalcule les positions des cases et des colonnes à partir du décalage du plateau."""
+        cell_size = self.cell_size
+        left = self._offset_x
+        top = self._offset_y
+        half = cell_size // 2
+
+        self._centers = [
+            [(left + col * cell_size + half, top + row * cell_size + half) for col in range(7)]
+            for row in range(6)
+        ]
+        self._column_boxes = [
+            (left + col * cell_size, top - 10, left + (col + 1) * cell_size, top + 6 * cell_size + 10)
+            for col in range(7)
+        ]
+        self._drop_y = top - half
+
+    def _static_board_coords(self, offset_x, offset_y, board_width, board_height):
+        """
+        Calcule les coordonnées des éléments statiques du plateau.
+
+        Args:
+            offset_x (int): Décalage X du plateau
+            offset_y (int): Décalage Y du plateau
+            board_width (int): Largeur du plateau
+            board_height (int): Hauteur du plateau
+
+        Returns:
+            list: Coordonnées dans l'ordre de self._static_item_ids puis self._corner_arc_ids
+        """
+        left = offset_x - 10
+        top = offset_y - 10
+        right = offset_x + board_width + 10
+        bottom = offset_y + board_height + 10
+        shadow_offset = 5
         corner_radius = 15
-        # Coins supérieurs gauche et droit
-        self.board_canvas.create_arc(
-            offset_x - 10, offset_y - 10,
-            offset_x - 10 + 2 * corner_radius, offset_y - 10 + 2 * corner_radius,
-            start=90, extent=90, outline=self.colors['accent'], style="arc", width=2
-        )
-        self.board_canvas.create_arc(
-            offset_x + board_width + 10 - 2 * corner_radius, offset_y - 10,
-            offset_x + board_width + 10, offset_y - 10 + 2 * corner_radius,
-            start=0, extent=90, outline=self.colors['accent'], style="arc", width=2
-        )
-        # Coins inférieurs gauche et droit
-        self.board_canvas.create_arc(
-            offset_x - 10, offset_y + board_height + 10 - 2 * corner_radius,
-            offset_x - 10 + 2 * corner_radius, offset_y + board_height + 10,
-            start=180, extent=90, outline=self.colors['accent'], style="arc", width=2
-        )
-        self.board_canvas.create_arc(
-            offset_x + board_width + 10 - 2 * corner_radius, offset_y + board_height + 10 - 2 * corner_radius,
-            offset_x + board_width + 10, offset_y + board_height + 10,
-            start=270, extent=90, outline=self.colors['accent'], style="arc", width=2
-        )
 
-        # Si une animation est en cours, dessiner la pièce animée
-        if self.animation_in_progress:
-            self._animate_piece()
-            return  # Retourner et laisser l'animation gérer le reste du dessin
+        coords = [(left + shadow_offset, top + shadow_offset, right + shadow_offset, bottom + shadow_offset)]
+        coords.extend((left + i, top + i, right - i, bottom - i) for i in range(10))
+        coords.append((left, top, right, bottom))
+
+        # Coins supérieurs gauche et droit, puis inférieurs gauche et droit
+        coords.append((left, top, left + 2 * corner_radius, top + 2 * corner_radius))
+        coords.append((right - 2 * corner_radius, top, right, top + 2 * corner_radius))
+        coords.append((left, bottom - 2 * corner_radius, left + 2 * corner_radius, bottom))
+        coords.append((right - 2 * corner_radius, bottom - 2 * corner_radius, right, bottom))
+        return coords
+
+    def _relayout_board(self):
+        """Replace les éléments du plateau selon la taille actuelle du canvas."""
+        board_width = 7 * self.cell_size
+        board_height = 6 * self.cell_size
+        offset_x = self._offset_x
+        offset_y = self._offset_y
+
+        item_ids = self._static_item_ids + self._corner_arc_ids
+        for item_id, coords in zip(item_ids, self._static_board_coords(offset_x, offset_y, board_width, board_height)):
+            self.board_canvas.coords(item_id, *coords)
 
-        # Dessiner les cellules et les pièces
         for row in range(6):
             for col in range(7):
-                # Position de la cellule
-                x = offset_x + col * self.cell_size + self.cell_size // 2
-                y = offset_y + row * self.cell_size + self.cell_size // 2
-
-                # Dessiner l'emplacement vide avec effet 3D
-                self._draw_cell(x, y, self.colors['empty'])
-
-                # Dessiner la pièce si présente
-                if self.board[row][col] == 1:
-                    self._draw_piece(x, y, self.colors['player1'], self.colors['player1_shadow'], row, col)
-                elif self.board[row][col] == 2:
-                    self._draw_piece(x, y, self.colors['player2'], self.colors['player2_shadow'], row, col)
-
-        # Dessiner la colonne en surbrillance
-        if self.highlight_column is not None and not self.is_game_over and self.match_id is not None and self.current_player == self.player_number:
-            # Dessiner un rectangle translucide sur toute la colonne
-            col_x = offset_x + self.highlight_column * self.cell_size
-            self.board_canvas.create_rectangle(
-                col_x, offset_y - 10,
-                col_x + self.cell_size, offset_y + board_height + 10,
-                fill=self.colors['highlight_col'], stipple="gray50", outline=""
-            )
+                center = self._centers[row][col]
+                self.board_canvas.coords(self._cell_ids[row][col], center)
+                self.board_canvas.coords(self._piece_ids[row][col], center)
+
+        # Forcer le repositionnement de la surbrillance au prochain dessin
+        self._prev_highlight = -1
+        self._draw_board()
+
+    def _set_piece_item(self, row, col, value):
+        """
+        Met à jour l'élément de la pièce d'une case.
+
+        Args:
+            row (int): Ligne de la case
+            col (int): Colonne de la case
+            value (int): Contenu de la case (0 vide, 1 ou 2 pour le joueur)
+        """
+        item_id = self._piece_ids[row][col]
+
+        # Les pièces gagnantes sont dessinées à part par l'animation de victoire
+        if value == 0 or (row, col) in self._prev_winning:
+            self.board_canvas.itemconfigure(item_id, state='hidden')
+        else:
+            sprite = self._get_piece_sprite(self.colors[f'player{value}'], self.colors[f'player{value}_shadow'])
+            self.board_canvas.itemconfigure(item_id, image=sprite, state='normal')
+
+    def _request_redraw(self):
+        """Planifie un redessin du plateau au prochain temps mort de Tk (les demandes successives sont fusionnées)."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Effectue le redessin du plateau planifié par _request_redraw."""
+        self._redraw_pending = False
+        self._draw_board()
+
+    def _draw_board(self):
+        """Met à jour le plateau de jeu en ne redessinant que ce qui a changé."""
+        # Cases dont l'état gagnant a changé
+        winning = set(self.winning_positions)
+        if winning != self._prev_winning:
+            changed = winning ^ self._prev_winning
+            self._prev_winning = winning
+            for row, col in changed:
+                self._set_piece_item(row, col, self.board[row * 7 + col])
+
+        # Mettre à jour uniquement les cases modifiées (bits différents entre les deux états)
+        changed = (self._bits1 ^ self._prev_bits1) | (self._bits2 ^ self._prev_bits2)
+        self._prev_bits1 = self._bits1
+        self._prev_bits2 = self._bits2
+        while changed:
+            bit = changed & -changed
+            index = bit.bit_length() - 1
+            row, col = divmod(index, 7)
+            self._set_piece_item(row, col, self.board[index])
+            changed ^= bit
+
+        # Redessiner les pièces gagnantes animées
+        if self._victory_drawn:
+            self.board_canvas.delete("victory")
+            self._victory_drawn = False
+        for row, col in self.winning_positions:
+            x, y = self._centers[row][col]
+            value = self.board[row * 7 + col]
+            self._draw_piece(x, y, self.colors[f'player{value}'], self.colors[f'player{value}_shadow'])
+            self._victory_drawn = True
+
+        # Colonne en surbrillance (uniquement pendant notre tour, hors animation)
+        highlight = self.highlight_column
+        if (self.is_game_over or self.match_id is None or self.current_player != self.player_number
+                or self.animation_in_progress):
+            highlight = None
+
+        if highlight != self._prev_highlight:
+            self._prev_highlight = highlight
+            if highlight is None:
+                if self._highlight_shown:
+                    self._highlight_shown = False
+                    self.board_canvas.itemconfigure(self._highlight_id, state='hidden')
+                    self.board_canvas.itemconfigure(self._ghost_id, state='hidden')
+            else:
+                # Sprite de la pièce fantôme, changé seulement si le joueur local a changé
+                if self._ghost_player != self.player_number:
+                    self._ghost_player = self.player_number
+                    self.board_canvas.itemconfigure(self._ghost_id, image=self._get_ghost_sprite(self.player_number))
+
+                # Rectangle translucide sur toute la colonne et pièce fantôme au-dessus
+                self.board_canvas.coords(self._highlight_id, self._column_boxes[highlight])
+                self.board_canvas.coords(self._ghost_id, self._centers[0][highlight][0], self._drop_y)
 
-            # Position de la cellule pour la pièce fantôme
-            x = offset_x + self.highlight_column * self.cell_size + self.cell_size // 2
-            y = offset_y - self.cell_size // 2
+                if not self._highlight_shown:
+                    self._highlight_shown = True
+                    self.board_canvas.itemconfigure(self._highlight_id, state='normal')
+                    self.board_canvas.itemconfigure(self._ghost_id, state='normal')
 
-            # Dessiner la pièce fantôme
-            piece_color = self.colors['player1'] if self.player_number == 1 else self.colors['player2']
-            shadow_color = self.colors['player1_shadow'] if self.player_number == 1 else self.colors['player2_shadow']
+    def _get_ghost_sprite(self, player_number):
+        """
+        Retourne le sprite de la pièce fantôme d'un joueur (couleurs éclaircies calculées une seule fois).
+
+        Args:
+            player_number (int): Numéro du joueur (1 ou 2)
+
+        Returns:
+            tk.PhotoImage: Sprite de la pièce fantôme
+        """
+        key = ("ghost", player_number)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            piece_color = self.colors[f'player{player_number}']
+            shadow_color = self.colors[f'player{player_number}_shadow']
 
             # Créer une version "fantôme" de la pièce
             ghost_color = self._blend_colors(piece_color, "#FFFFFF", 0.7)
             ghost_shadow = self._blend_colors(shadow_color, "#FFFFFF", 0.7)
+            sprite = self._get_piece_sprite(ghost_color, ghost_shadow, ghost=True)
+            self._sprites[key] = sprite
+        return sprite
 
-            self._draw_piece(x, y, ghost_color, ghost_shadow, -1, self.highlight_column, ghost=True)
-
-    def _draw_cell(self, x, y, color):
+    def _render_sprite(self, radius, pixel_color):
         """
-        Dessine une cellule vide du plateau avec un effet 3D.
+        Pré-rend un sprite circulaire dans une PhotoImage (les pixels non dessinés restent transparents).
 
         Args:
-            x (int): Position X du centre de la cellule
-            y (int): Position Y du centre de la cellule
-            color (str): Couleur de la cellule
-        """
-        # Rayon externe légèrement plus grand que le rayon des pièces
-        outer_radius = self.piece_radius + 2
-        inner_radius = self.piece_radius
+            radius (float): Rayon extérieur du sprite
+            pixel_color (callable): Fonction (dx, dy, distance) renvoyant la couleur du pixel ou None
 
-        # Dessiner un cercle externe pour l'effet d'ombre
-        self.board_canvas.create_oval(
-            x - outer_radius, y - outer_radius,
-            x + outer_radius, y + outer_radius,
-            fill="#151521", outline=""
-        )
+        Returns:
+            tk.PhotoImage: Image du sprite, centrée sur son pixel central
+        """
+        size = 2 * int(math.ceil(radius)) + 1
+        center = size // 2
+        image = tk.PhotoImage(width=size, height=size)
+
+        for py in range(size):
+            dy = py - center
+            start = None
+            colors = []
+            for px in range(size):
+                dx = px - center
+                color = pixel_color(dx, dy, math.hypot(dx, dy))
+                if color is None:
+                    continue
+                if start is None:
+                    start = px
+                colors.append(color)
+
+            # Les formes sont convexes : chaque ligne est un segment continu
+            if colors:
+                image.put("{" + " ".join(colors) + "}", to=(start, py))
+
+        return image
+
+    def _get_cell_sprite(self, color):
+        """
+        Renvoie le sprite d'une cellule vide, en le créant au premier appel.
 
-        # Dessiner le trou au milieu
-        self.board_canvas.create_oval(
-            x - inner_radius, y - inner_radius,
-            x + inner_radius, y + inner_radius,
-            fill=color, outline="#191B2A", width=1
-        )
+        Args:
+            color (str): Couleur de la cellule
 
-        # Ajouter un effet de lumière au bord supérieur
-        self.board_canvas.create_arc(
-            x - inner_radius, y - inner_radius,
-            x + inner_radius, y + inner_radius,
-            start=45, extent=180, fill="", outline="#2D2F43", width=1
-        )
+        Returns:
+            tk.PhotoImage: Sprite de la cellule
+        """
+        key = ("cell", color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            outer_radius = self.piece_radius + 2
+            inner_radius = self.piece_radius
+
+            def pixel_color(dx, dy, distance):
+                if distance > outer_radius:
+                    return None
+                if distance > inner_radius:
+                    # Cercle externe pour l'effet d'ombre
+                    return "#151521"
+                if distance > inner_radius - 1:
+                    # Lumière au bord supérieur, ombre au bord inférieur
+                    angle = math.degrees(math.atan2(-dy, dx)) % 360
+                    return "#2D2F43" if 45 <= angle < 225 else "#161826"
+                return color
+
+            sprite = self._render_sprite(outer_radius, pixel_color)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _get_piece_sprite(self, color, shadow_color, ghost=False):
+        """
+        Renvoie le sprite d'une pièce (hors animation de victoire), en le créant au premier appel.
 
-        # Ajouter un effet d'ombre au bord inférieur
-        self.board_canvas.create_arc(
-            x - inner_radius, y - inner_radius,
-            x + inner_radius, y + inner_radius,
-            start=225, extent=180, fill="", outline="#161826", width=1
-        )
+        Args:
+            color (str): Couleur principale de la pièce
+            shadow_color (str): Couleur de l'ombre de la pièce
+            ghost (bool): Si True, sprite de la pièce fantôme
 
-    def _draw_piece(self, x, y, color, shadow_color, row, col, ghost=False):
+        Returns:
+            tk.PhotoImage: Sprite de la pièce
+        """
+        key = ("piece", color, shadow_color, ghost)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            radius = self.piece_radius * (0.9 if ghost else 1)
+            inner_radius = radius * 0.85
+
+            # Mêmes couches que le dessin vectoriel : dégradé puis reflet (stipple gray25)
+            layers = []
+            for i in range(3):
+                factor = i / 3
+                layers.append((radius - (radius - inner_radius) * factor,
+                               self._blend_colors(color, "#FFFFFF", factor * 0.4)))
+            highlight_radius = radius * 0.25
+            highlight_center = -radius * 0.45
+
+            def pixel_color(dx, dy, distance):
+                if distance > radius:
+                    return None
+                pixel = shadow_color
+                for layer_radius, layer_color in layers:
+                    if distance <= layer_radius:
+                        pixel = layer_color
+                if math.hypot(dx - highlight_center, dy - highlight_center) <= highlight_radius:
+                    pixel = self._blend_colors(pixel, "#FFFFFF", 0.25)
+                return pixel
+
+            sprite = self._render_sprite(radius, pixel_color)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _draw_piece(self, x, y, color, shadow_color):
         """
-        Dessine une pièce avec des effets 3D.
+        Dessine une pièce gagnante avec des effets 3D et l'animation de victoire.
 
         Args:
             x (int): Position X du centre de la pièce
             y (int): Position Y du centre de la pièce
             color (str): Couleur principale de la pièce
             shadow_color (str): Couleur de l'ombre de la pièce
-            row (int): Ligne de la pièce dans le plateau
-            col (int): Colonne de la pièce dans le plateau
-            ghost (bool): Si True, dessine une pièce fantôme (pour la prévisualisation)
         """
-        # Vérifier si cette pièce fait partie des positions gagnantes
-        is_winning = False
-        highlight_pulse = 0
-
-        if self.winning_positions and (row, col) in self.winning_positions:
-            is_winning = True
-            # Effet de pulsation pour l'animation de victoire
-            highlight_pulse = math.sin(self.victory_animation_step * 0.5) * 5
+        # Effet de pulsation pour l'animation de victoire
+        highlight_pulse = _fast_sin(self.victory_animation_step * 0.5) * 5
 
         # Rayon de base et rayon interne pour l'effet 3D
         radius = self.piece_radius
         inner_radius = radius * 0.85
 
-        # Pour les pièces fantômes, utiliser un rayon légèrement plus petit
-        if ghost:
-            radius *= 0.9
-            inner_radius *= 0.9
-
-        # Si c'est une pièce gagnante, faire varier le rayon pour l'animation
-        if is_winning:
-            radius += highlight_pulse
-            inner_radius += highlight_pulse * 0.85
+        # Faire varier le rayon de la pièce gagnante pour l'animation
+        radius += highlight_pulse
+        inner_radius += highlight_pulse * 0.85
 
         # Dessiner l'ombre de la pièce
         self.board_canvas.create_oval(
             x - radius, y - radius,
             x + radius, y + radius,
-            fill=shadow_color, outline=""
+            fill=shadow_color, outline="", tags="victory"
         )
 
         # Créer un dégradé pour l'effet 3D
@@ -827,19 +1114,14 @@ class ConnectFourGUI:
             factor = i / 3
             r = radius - (radius - inner_radius) * factor
 
-            # Couleur plus claire vers le centre
-            if is_winning:
-                # Pour les pièces gagnantes, utiliser un effet de couleur brillante qui varie
-                highlight_color = "#FFFFFF" if self.victory_animation_step % 6 < 3 else color
-                piece_color = self._blend_colors(color, highlight_color, factor * 0.7)
-            else:
-                # Pour les pièces normales, un simple dégradé
-                piece_color = self._blend_colors(color, "#FFFFFF", factor * 0.4)
+            # Pour les pièces gagnantes, utiliser un effet de couleur brillante qui varie
+            highlight_color = "#FFFFFF" if self.victory_animation_step % 6 < 3 else color
+            piece_color = self._blend_colors(color, highlight_color, factor * 0.7)
 
             self.board_canvas.create_oval(
                 x - r, y - r,
                 x + r, y + r,
-                fill=piece_color, outline=""
+                fill=piece_color, outline="", tags="victory"
             )
 
         # Ajouter un reflet lumineux dans le coin supérieur gauche
@@ -849,20 +1131,19 @@ class ConnectFourGUI:
         self.board_canvas.create_oval(
             x - radius + highlight_offset, y - radius + highlight_offset,
             x - radius + highlight_offset + highlight_size, y - radius + highlight_offset + highlight_size,
-            fill="#FFFFFF", outline="", stipple="gray25"
+            fill="#FFFFFF", outline="", stipple="gray25", tags="victory"
         )
 
-        # Pour les pièces gagnantes, ajouter un halo
-        if is_winning:
-            glow_color = "#FFFFFF" if self.victory_animation_step % 6 < 3 else color
-            for i in range(3):
-                glow_radius = radius + 2 + i * 2
-                glow_alpha = "gray75" if i == 0 else ("gray50" if i == 1 else "gray25")
-                self.board_canvas.create_oval(
-                    x - glow_radius, y - glow_radius,
-                    x + glow_radius, y + glow_radius,
-                    outline=glow_color, width=2, stipple=glow_alpha
-                )
+        # Ajouter un halo autour de la pièce gagnante
+        glow_color = "#FFFFFF" if self.victory_animation_step % 6 < 3 else color
+        for i in range(3):
+            glow_radius = radius + 2 + i * 2
+            glow_alpha = "gray75" if i == 0 else ("gray50" if i == 1 else "gray25")
+            self.board_canvas.create_oval(
+                x - glow_radius, y - glow_radius,
+                x + glow_radius, y + glow_radius,
+                outline=glow_color, width=2, stipple=glow_alpha, tags="victory"
+            )
 
     def _animate_piece(self):
         """Gère l'animation de chute d'une pièce."""
@@ -880,26 +1161,11 @@ class ConnectFourGUI:
 
         # Ajouter un petit effet de rebond
         if progress > 0.9:
-            bounce_effect = math.sin((progress - 0.9) * 10 * math.pi) * 5 * (1 - progress) * 10
+            bounce_effect = _fast_sin((progress - 0.9) * 10 * math.pi) * (1 - progress) * 50
             y_position += bounce_effect
 
-        # Calculer les dimensions du plateau
-        board_width = 7 * self.cell_size
-        board_height = 6 * self.cell_size
-        canvas_width = self.board_canvas.winfo_width()
-        canvas_height = self.board_canvas.winfo_height()
-        offset_x = (canvas_width - board_width) // 2
-        offset_y = (canvas_height - board_height) // 2
-
-        # Effacer le canvas et redessiner le plateau sans la pièce animée
-        self.board_canvas.delete("all")
-        self._draw_static_board(offset_x, offset_y, board_width, board_height)
-
-        # Dessiner la pièce animée avec la couleur correcte du joueur
-        player_color = self.colors['player1'] if self.animation_player == 1 else self.colors['player2']
-        shadow_color = self.colors['player1_shadow'] if self.animation_player == 1 else self.colors['player2_shadow']
-
-        self._draw_piece(self.animation_x, y_position, player_color, shadow_color, -1, -1)
+        # Déplacer la pièce animée, le reste du plateau n'est pas redessiné
+        self.board_canvas.coords(self._falling_id, self.animation_x, y_position)
 
         # Continuer l'animation si elle n'est pas terminée
         if progress < 1.0:
@@ -907,84 +1173,9 @@ class ConnectFourGUI:
         else:
             # Animation terminée
             self.animation_in_progress = False
+            self.board_canvas.itemconfigure(self._falling_id, state='hidden')
             self._draw_board()
 
-    def _draw_static_board(self, offset_x, offset_y, board_width, board_height):
-        """
-        Dessine le plateau sans la pièce en cours d'animation.
-
-        Args:
-            offset_x (int): Décalage X du plateau
-            offset_y (int): Décalage Y du plateau
-            board_width (int): Largeur du plateau
-            board_height (int): Hauteur du plateau
-        """
-        # Dessiner un effet d'ombre pour le plateau
-        shadow_offset = 5
-        self.board_canvas.create_rectangle(
-            offset_x - 10 + shadow_offset, offset_y - 10 + shadow_offset,
-            offset_x + board_width + 10 + shadow_offset, offset_y + board_height + 10 + shadow_offset,
-            fill="#151521", outline="", width=0
-        )
-
-        # Dessiner le fond du plateau avec un effet de dégradé
-        for i in range(10):
-            factor = i / 10
-            color = self._blend_colors(self.colors['board'], "#23253D", factor)
-            self.board_canvas.create_rectangle(
-                offset_x - 10 + i, offset_y - 10 + i,
-                offset_x + board_width + 10 - i, offset_y + board_height + 10 - i,
-                fill=color, outline=self.colors['board_border'], width=1
-            )
-
-        # Dessiner une bordure extérieure brillante
-        self.board_canvas.create_rectangle(
-            offset_x - 10, offset_y - 10,
-            offset_x + board_width + 10, offset_y + board_height + 10,
-            fill="", outline=self.colors['accent'], width=2
-        )
-
-        # Dessiner des décorations pour le plateau (coins arrondis)
-        corner_radius = 15
-        # Coins supérieurs gauche et droit
-        self.board_canvas.create_arc(
-            offset_x - 10, offset_y - 10,
-            offset_x - 10 + 2 * corner_radius, offset_y - 10 + 2 * corner_radius,
-            start=90, extent=90, outline=self.colors['accent'], style="arc", width=2
-        )
-        self.board_canvas.create_arc(
-            offset_x + board_width + 10 - 2 * corner_radius, offset_y - 10,
-            offset_x + board_width + 10, offset_y - 10 + 2 * corner_radius,
-            start=0, extent=90, outline=self.colors['accent'], style="arc", width=2
-        )
-        # Coins inférieurs gauche et droit
-        self.board_canvas.create_arc(
-            offset_x - 10, offset_y + board_height + 10 - 2 * corner_radius,
-            offset_x - 10 + 2 * corner_radius, offset_y + board_height + 10,
-            start=180, extent=90, outline=self.colors['accent'], style="arc", width=2
-        )
-        self.board_canvas.create_arc(
-            offset_x + board_width + 10 - 2 * corner_radius, offset_y + board_height + 10 - 2 * corner_radius,
-            offset_x + board_width + 10, offset_y + board_height + 10,
-            start=270, extent=90, outline=self.colors['accent'], style="arc", width=2
-        )
-
-        # Dessiner les cellules et les pièces (sauf celle en cours d'animation)
-        for row in range(6):
-            for col in range(7):
-                # Position de la cellule
-                x = offset_x + col * self.cell_size + self.cell_size // 2
-                y = offset_y + row * self.cell_size + self.cell_size // 2
-
-                # Dessiner l'emplacement vide avec effet 3D
-                self._draw_cell(x, y, self.colors['empty'])
-
-                # Dessiner la pièce si présente et que ce n'est pas celle qu'on vient de jouer
-                if self.board[row][col] == 1:
-                    self._draw_piece(x, y, self.colors['player1'], self.colors['player1_shadow'], row, col)
-                elif self.board[row][col] == 2:
-                    self._draw_piece(x, y, self.colors['player2'], self.colors['player2_shadow'], row, col)
-
     def _on_play_button_click(self):
         """Gère le clic sur le bouton Jouer."""
         if self.connected:
@@ -1017,32 +1208,27 @@ class ConnectFourGUI:
         Args:
             event: Événement de mouvement de souris
         """
-        if self.match_id is None or self.is_game_over or self.current_player != self.player_number or self.animation_in_progress:
-            self.highlight_column = None
-            return
+        new_column = None
 
-        # Calculer les dimensions du plateau
-        board_width = 7 * self.cell_size
+        if not (self.match_id is None or self.is_game_over or self.current_player != self.player_number
+                or self.animation_in_progress):
+            board_width = 7 * self.cell_size
+            offset_x = self._offset_x
 
-        # Centrer le plateau dans le canvas
-        canvas_width = self.board_canvas.winfo_width()
-        offset_x = (canvas_width - board_width) // 2
-
-        # Calculer la colonne
-        if offset_x <= event.x <= offset_x + board_width:
-            col = (event.x - offset_x) // self.cell_size
-
-            # Vérifier si la colonne est valide
-            if 0 <= col < 7 and self.board[0][col] == 0:
-                if self.highlight_column != col:
-                    self.highlight_column = col
-                    self._draw_board()
-            elif self.highlight_column is not None:
-                self.highlight_column = None
-                self._draw_board()
-        elif self.highlight_column is not None:
-            self.highlight_column = None
-            self._draw_board()
+            # Calculer la colonne
+            if offset_x <= event.x <= offset_x + board_width:
+                col = (event.x - offset_x) // self.cell_size
+
+                # Vérifier si la colonne est valide
+                if 0 <= col < 7 and not ((self._bits1 | self._bits2) >> col) & 1:
+                    new_column = col
+
+        # Ne rien redessiner tant que la souris reste dans la même colonne
+        if new_column == self.highlight_column:
+            return
+
+        self.highlight_column = new_column
+        self._request_redraw()
 
     def _on_mouse_click(self, event):
         """
@@ -1056,34 +1242,35 @@ class ConnectFourGUI:
 
         # Jouer dans la colonne surbrillée
         if self.play_callback:
-            # Calculer les dimensions du plateau
-            board_width = 7 * self.cell_size
-            board_height = 6 * self.cell_size
-            canvas_width = self.board_canvas.winfo_width()
-            canvas_height = self.board_canvas.winfo_height()
-            offset_x = (canvas_width - board_width) // 2
-            offset_y = (canvas_height - board_height) // 2
-
             # Stocker la colonne jouée
             column_played = self.highlight_column
 
             # Démarrer l'animation de chute
             self.animation_in_progress = True
-            self.animation_x = offset_x + column_played * self.cell_size + self.cell_size // 2
-            self.animation_start_y = offset_y - self.cell_size // 2
+            self.animation_x = self._centers[0][column_played][0]
+            self.animation_start_y = self._drop_y
 
             # Trouver la position finale de la pièce
             row = 5
-            while row >= 0 and self.board[row][column_played] != 0:
+            while row >= 0 and self.board[row * 7 + column_played] != 0:
                 row -= 1
 
             # Stocker le joueur actuel pour l'animation
             self.animation_player = self.player_number
 
-            self.animation_end_y = offset_y + row * self.cell_size + self.cell_size // 2
+            self.animation_end_y = self._centers[row][column_played][1]
             self.animation_start_time = time.time() * 1000
 
-            # Démarrer l'animation
+            # Afficher la pièce animée avec la couleur correcte du joueur
+            player_color = self.colors['player1'] if self.animation_player == 1 else self.colors['player2']
+            shadow_color = self.colors['player1_shadow'] if self.animation_player == 1 else self.colors['player2_shadow']
+            self.board_canvas.coords(self._falling_id, self.animation_x, self.animation_start_y)
+            self.board_canvas.itemconfigure(self._falling_id, state='normal',
+                                            image=self._get_piece_sprite(player_color, shadow_color))
+            self.board_canvas.tag_raise(self._falling_id)
+
+            # Cacher la surbrillance pendant la chute puis démarrer l'animation
+            self._draw_board()
             self._animate_piece()
 
             # Envoyer le coup au serveur
@@ -1092,6 +1279,7 @@ class ConnectFourGUI:
     def set_connected(self, connected):
         """
         Définit l'état de connexion au serveur.
+        À appeler depuis le thread de Tk.
 
         Args:
             connected (bool): True si connecté, False sinon
@@ -1102,6 +1290,7 @@ class ConnectFourGUI:
     def set_in_queue(self, in_queue):
         """
         Définit l'état de file d'attente.
+        À appeler depuis le thread de Tk.
 
         Args:
             in_queue (bool): True si dans la file, False sinon
@@ -1120,6 +1309,7 @@ class ConnectFourGUI:
     def update_queue_info(self, players_in_queue, games_in_progress):
         """
         Met à jour les informations sur la file d'attente.
+        À appeler depuis le thread de Tk.
 
         Args:
             players_in_queue (int): Nombre de joueurs dans la file
@@ -1134,9 +1324,23 @@ class ConnectFourGUI:
         elif self.current_screen == "queue":
             self._update_queue_screen()
 
+    def _schedule_game_update(self):
+        """Planifie la mise à jour de l'écran de jeu (les mises à jour rapprochées sont fusionnées)."""
+        self._board_dirty = True
+        if not self._draw_scheduled:
+            self._draw_scheduled = True
+            self.root.after_idle(self._flush_draw)
+
+    def _flush_draw(self):
+        """Met à jour l'écran de jeu une seule fois pour toutes les modifications en attente."""
+        self._draw_scheduled = False
+        if self.current_screen == "game":
+            self._update_game_screen()
+
     def start_game(self, match_id, player_number, your_turn, opponent_name, board):
         """
         Démarre une partie.
+        À appeler depuis le thread de Tk.
 
         Args:
             match_id (int): ID du match
@@ -1149,7 +1353,7 @@ class ConnectFourGUI:
         self.player_number = player_number
         self.current_player = 1  # Le joueur 1 commence toujours dans le Puissance 4
         self.opponent_name = opponent_name
-        self.board = board
+        self._set_board(_flatten_board(board))
         self.is_game_over = False
         self.winner = None
         self.winning_positions = []
@@ -1160,34 +1364,42 @@ class ConnectFourGUI:
         # Passer à l'écran de jeu
         self._show_screen("game")
 
-        # Afficher un message
-        messagebox.showinfo("Partie démarrée",
-                            f"Vous jouez contre {opponent_name} !\nVous êtes le joueur {player_number}.")
+        # Afficher un message sans bloquer le dessin du plateau
+        self.root.after(50, messagebox.showinfo, "Partie démarrée",
+                        f"Vous jouez contre {opponent_name} !\nVous êtes le joueur {player_number}.")
 
     def update_game(self, board, your_turn):
         """
         Met à jour l'état de la partie.
+        À appeler depuis le thread de Tk.
 
         Args:
             board (list): Nouvel état du plateau
             your_turn (bool): True si c'est le tour du joueur
         """
-        self.board = board
-        self.current_player = self.player_number if your_turn else (3 - self.player_number)
+        current_player = self.player_number if your_turn else (3 - self.player_number)
 
-        # Mettre à jour l'interface si nous sommes sur l'écran de jeu
-        if self.current_screen == "game" and not self.animation_in_progress:
-            self._update_game_screen()
+        # Rien à redessiner si le serveur renvoie un état identique
+        cells = _flatten_board(board)
+        if cells == self.board and current_player == self.current_player:
+            return
+
+        self._set_board(cells)
+        self.current_player = current_player
+
+        # Mettre à jour l'interface au prochain temps mort de Tk
+        self._schedule_game_update()
 
     def end_game(self, board, winner):
         """
         Termine une partie.
+        À appeler depuis le thread de Tk.
 
         Args:
             board (list): État final du plateau
             winner (int): Numéro du joueur gagnant (0 pour match nul)
         """
-        self.board = board
+        self._set_board(_flatten_board(board))
         self.is_game_over = True
         self.winner = winner
         self.match_id = None
@@ -1195,7 +1407,7 @@ class ConnectFourGUI:
         # Trouver les positions gagnantes pour l'animation
         self.winning_positions = []
         if winner != 0:  # Si ce n'est pas un match nul
-            self._find_winning_positions(board, winner)
+            self._find_winning_positions(winner)
 
         # Démarrer l'animation de victoire
         if self.winning_positions:
@@ -1203,72 +1415,56 @@ class ConnectFourGUI:
             self.victory_animation_step = 0
             self._animate_victory()
 
-        # Mettre à jour l'interface si nous sommes sur l'écran de jeu
-        if self.current_screen == "game":
-            self._update_game_screen()
+        # Mettre à jour l'interface au prochain temps mort de Tk
+        self._schedule_game_update()
 
-        # Afficher un message
+        # Afficher un message une fois le plateau final dessiné
         if winner == 0:
-            messagebox.showinfo("Match nul", "La partie est terminée. Match nul !")
+            self.root.after(50, messagebox.showinfo, "Match nul", "La partie est terminée. Match nul !")
         elif winner == self.player_number:
-            messagebox.showinfo("Victoire", "Félicitations, vous avez gagné !")
+            self.root.after(50, messagebox.showinfo, "Victoire", "Félicitations, vous avez gagné !")
         else:
-            messagebox.showinfo("Défaite", "Vous avez perdu. Meilleure chance la prochaine fois !")
+            self.root.after(50, messagebox.showinfo, "Défaite",
+                            "Vous avez perdu. Meilleure chance la prochaine fois !")
 
-    def _find_winning_positions(self, board, winner):
+    def _set_board(self, cells):
+        """
+        Remplace le plateau et recalcule l'occupation de chaque joueur sous forme d'entiers.
+
+        Args:
+            cells (array.array): Nouvel état du plateau à plat (voir _flatten_board)
+        """
+        self.board = cells
+        self._board_dirty = True
+        bits1 = bits2 = 0
+        for i, value in enumerate(cells):
+            if value == 1:
+                bits1 |= 1 << i
+            elif value == 2:
+                bits2 |= 1 << i
+        self._bits1 = bits1
+        self._bits2 = bits2
+
+    def _find_winning_positions(self, winner):
         """
         Trouve les positions des pièces qui forment une combinaison gagnante.
 
         Args:
-            board (list): Plateau de jeu
             winner (int): Numéro du joueur gagnant
         """
         # Réinitialiser les positions gagnantes
         self.winning_positions = []
 
-        # Vérifier horizontalement
-        for row in range(6):
-            for col in range(4):
-                if (board[row][col] == winner and
-                        board[row][col] == board[row][col + 1] ==
-                        board[row][col + 2] == board[row][col + 3]):
-                    for i in range(4):
-                        self.winning_positions.append((row, col + i))
-                    return
-
-        # Vérifier verticalement
-        for row in range(3):
-            for col in range(7):
-                if (board[row][col] == winner and
-                        board[row][col] == board[row + 1][col] ==
-                        board[row + 2][col] == board[row + 3][col]):
-                    for i in range(4):
-                        self.winning_positions.append((row + i, col))
-                    return
-
-        # Vérifier diagonalement (bas gauche vers haut droit)
-        for row in range(3, 6):
-            for col in range(4):
-                if (board[row][col] == winner and
-                        board[row][col] == board[row - 1][col + 1] ==
-                        board[row - 2][col + 2] == board[row - 3][col + 3]):
-                    for i in range(4):
-                        self.winning_positions.append((row - i, col + i))
-                    return
-
-        # Vérifier diagonalement (haut gauche vers bas droit)
-        for row in range(3):
-            for col in range(4):
-                if (board[row][col] == winner and
-                        board[row][col] == board[row + 1][col + 1] ==
-                        board[row + 2][col + 2] == board[row + 3][col + 3]):
-                    for i in range(4):
-                        self.winning_positions.append((row + i, col + i))
-                    return
+        cells = self.board
+        for a, b, c, d in WIN_LINES:
+            if cells[a] == winner and cells[b] == winner and cells[c] == winner and cells[d] == winner:
+                self.winning_positions = [divmod(i, 7) for i in (a, b, c, d)]
+                return
 
     def show_error(self, message):
         """
         Affiche un message d'erreur.
+        À appeler depuis le thread de Tk.
 
         Args:
             message (str): Message d'erreur
@@ -1278,6 +1474,7 @@ class ConnectFourGUI:
     def show_info(self, message):
         """
         Affiche un message d'information.
+        À appeler depuis le thread de Tk.
 
         Args:
             message (str): Message d'information
@@ -1,11 +1,11 @@
 """
 Module de communication réseau pour le client Puissance 4.
 """
+import collections
 import socket
 import threading
-import queue
-import time
-from common.protocol import MessageType, create_message, parse_message
+import selectors
+from common.protocol import MessageType, create_message, parse_message, FrameReader
 
 class NetworkClient:
     """Client réseau pour la communication avec le serveur."""
@@ -24,9 +24,13 @@ class NetworkClient:
         self.socket = None
         self.connected = False
         self.message_callback = message_callback
-        self.receive_thread = None
-        self.send_queue = queue.Queue()
-        self.send_thread = None
+        self._marshal = None  # Fonction exécutant le callback dans un autre thread (ex: Tk)
+        self.io_thread = None
+        self._send_queue = collections.deque()  # Messages encodés en attente d'envoi
+        self._send_lock = threading.Lock()
+        self._closing = False
+        self._wakeup_r = None
+        self._wakeup_w = None
 
     def connect(self):
         """
@@ -38,19 +42,21 @@ class NetworkClient:
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.connect((self.host, self.port))
-            self.socket.setblocking(True)
-            self.socket.settimeout(0.5)  # Timeout de 500ms
+            # Envoyer les coups immédiatement, sans attendre l'algorithme de Nagle
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setblocking(False)
+
+            # Paire de sockets permettant de réveiller le thread réseau (envoi ou déconnexion)
+            self._wakeup_r, self._wakeup_w = socket.socketpair()
+            self._wakeup_r.setblocking(False)
+            self._send_queue.clear()
+            self._closing = False
             self.connected = True
 
-            # Démarrer le thread de réception
-            self.receive_thread = threading.Thread(target=self._receive_loop)
-            self.receive_thread.daemon = True
-            self.receive_thread.start()
-
-            # Démarrer le thread d'envoi
-            self.send_thread = threading.Thread(target=self._send_loop)
-            self.send_thread.daemon = True
-            self.send_thread.start()
+            # Démarrer le thread réseau (réception et envoi)
+            self.io_thread = threading.Thread(target=self._io_loop)
+            self.io_thread.daemon = True
+            self.io_thread.start()
 
             return True
 
@@ -62,96 +68,130 @@ class NetworkClient:
         """Ferme la connexion avec le serveur."""
         if self.connected:
             try:
-                # Envoyer un message de déconnexion
+                # Envoyer un message de déconnexion puis demander l'arrêt du thread réseau
                 self.send_message(MessageType.DISCONNECT)
+                self._closing = True
+                self._wake()
+
+                # Laisser le thread réseau vider la file d'envoi avant de fermer le socket
+                if self.io_thread and self.io_thread is not threading.current_thread():
+                    self.io_thread.join(timeout=1.0)
 
-                # Fermer le socket
+                self.connected = False
                 self.socket.close()
             except Exception as e:
                 print(f"Erreur lors de la déconnexion: {e}")
             finally:
                 self.connected = False
 
-    def _receive_loop(self):
-        """Boucle de réception des messages."""
-        buffer = b""
+    def _wake(self):
+        """Réveille le thread réseau bloqué dans select()."""
+        try:
+            self._wakeup_w.send(b"\0")
+        except OSError:
+            # Le thread réseau est déjà terminé
+            pass
+
+    def _io_loop(self):
+        """Boucle unique de réception et d'envoi des messages."""
+        reader = FrameReader()
+        out = bytearray()  # Octets à envoyer dès que le socket est prêt
+        selector = selectors.DefaultSelector()
+        selector.register(self.socket, selectors.EVENT_READ)
+        selector.register(self._wakeup_r, selectors.EVENT_READ)
+        watching_write = False
 
         try:
             while self.connected:
-                try:
-                    # Recevoir des données
-                    data = self.socket.recv(4096)
-                    if not data:
-                        # Connexion fermée par le serveur
-                        break
-
-                    buffer += data
-
-                    # Traiter tous les messages complets dans le buffer
-                    while b"\n" in buffer:
-                        message_bytes, buffer = buffer.split(b"\n", 1)
-
-                        # Traiter le message
-                        msg_type, data = parse_message(message_bytes)
-
-                        # Appeler le callback si défini
-                        if self.message_callback:
-                            self.message_callback(msg_type, data)
-
-                except socket.timeout:
-                    # Ignorer les timeouts, c'est normal
-                    continue
-                except socket.error as e:
-                    if hasattr(e, 'errno') and e.errno == 10035:  # WSAEWOULDBLOCK
-                        # Opération non bloquante qui n'a pas pu être complétée immédiatement
-                        # C'est normal, continuer
-                        continue
-                    else:
-                        # Autre erreur socket
-                        raise
+                # Attendre des données, de la place pour écrire ou un réveil (aucun réveil périodique)
+                for key, mask in selector.select():
+                    if key.fileobj is self._wakeup_r:
+                        try:
+                            self._wakeup_r.recv(4096)
+                        except BlockingIOError:
+                            pass
+
+                        # Récupérer en une fois tous les messages en attente
+                        with self._send_lock:
+                            chunks = list(self._send_queue)
+                            self._send_queue.clear()
+                        if chunks:
+                            out += b"".join(chunks)
+
+                    elif mask & selectors.EVENT_READ:
+                        # Recevoir des données directement dans le tampon
+                        try:
+                            if not reader.recv_from(self.socket):
+                                # Connexion fermée par le serveur
+                                return
+                        except BlockingIOError:
+                            continue
+
+                        # Traiter tous les messages complets dans le tampon
+                        for message_bytes in reader.read_frames():
+                            # Traiter le message
+                            msg_type, data = parse_message(message_bytes)
+
+                            # Transmettre le message au callback
+                            self._dispatch(msg_type, data)
+
+                # Envoyer autant que le socket l'accepte
+                if out:
+                    try:
+                        sent = self.socket.send(out)
+                        del out[:sent]
+                    except BlockingIOError:
+                        pass
+
+                if self._closing and not out and not self._send_queue:
+                    # Tout a été envoyé, la déconnexion peut se terminer
+                    return
+
+                # Surveiller l'écriture uniquement s'il reste des données à envoyer
+                if bool(out) != watching_write:
+                    watching_write = bool(out)
+                    events = selectors.EVENT_READ | (selectors.EVENT_WRITE if watching_write else 0)
+                    selector.modify(self.socket, events)
 
         except Exception as e:
             if self.connected:  # Ignorer les erreurs après déconnexion
-                print(f"Erreur lors de la réception: {e}")
+                print(f"Erreur réseau: {e}")
 
         finally:
             # Marquer comme déconnecté
             self.connected = False
+            selector.close()
+            self._wakeup_r.close()
+            self._wakeup_w.close()
 
-            # Appeler le callback avec une erreur si défini
-            if self.message_callback:
-                self.message_callback(MessageType.ERROR, {"error": "Déconnecté du serveur"})
+            # Signaler la déconnexion au callback
+            self._dispatch(MessageType.ERROR, {"error": "Déconnecté du serveur"})
 
-    def _send_loop(self):
-        """Boucle d'envoi des messages."""
-        try:
-            while self.connected:
-                try:
-                    # Récupérer un message de la file d'attente (avec timeout)
-                    message = self.send_queue.get(timeout=0.1)
-
-                    # Envoyer le message
-                    self.socket.sendall(message)
-
-                    # Marquer comme traité
-                    self.send_queue.task_done()
-
-                except queue.Empty:
-                    # Ignorer les timeouts, c'est normal
-                    continue
-                except socket.error as e:
-                    if hasattr(e, 'errno') and e.errno == 10035:  # WSAEWOULDBLOCK
-                        # Réessayer plus tard
-                        self.send_queue.put(message)
-                        time.sleep(0.1)
-                        continue
-                    else:
-                        # Autre erreur socket
-                        raise
+    def set_marshaller(self, marshal):
+        """
+        Définit comment les messages reçus sont transmis au callback.
 
-        except Exception as e:
-            if self.connected:  # Ignorer les erreurs après déconnexion
-                print(f"Erreur lors de l'envoi: {e}")
+        Args:
+            marshal (callable): Fonction appelée avec (callback, msg_type, data) qui planifie
+                l'appel du callback, par exemple dans la boucle d'événements Tk.
+                None pour appeler le callback directement dans le thread réseau.
+        """
+        self._marshal = marshal
+
+    def _dispatch(self, msg_type, data):
+        """
+        Transmet un message reçu au callback.
+
+        Args:
+            msg_type (MessageType): Type de message
+            data (dict): Données du message
+        """
+        if not self.message_callback:
+            return
+        if self._marshal:
+            self._marshal(self.message_callback, msg_type, data)
+        else:
+            self.message_callback(msg_type, data)
 
     def send_message(self, msg_type, data=None):
         """
@@ -168,8 +208,12 @@ class NetworkClient:
             # Créer le message
             message = create_message(msg_type, data)
 
-            # Ajouter à la file d'attente
-            self.send_queue.put(message)
+            # Ajouter à la file d'attente et réveiller le thread réseau s'il ne l'est pas déjà
+            with self._send_lock:
+                wake = not self._send_queue
+                self._send_queue.append(message)
+            if wake:
+                self._wake()
 
             return True
 
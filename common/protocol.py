@@ -1,8 +1,17 @@
 """
 Protocole de communication entre le client et le serveur pour le jeu Puissance 4.
 """
+import collections
 import json
+import struct
 from enum import Enum, auto
+from typing import NamedTuple
+
+try:
+    # orjson (optionnel) encode et décode directement en bytes, bien plus vite que json
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class MessageType(Enum):
@@ -28,6 +37,82 @@ class GameResult(Enum):
     IN_PROGRESS = auto()
 
 
+# Correspondance nom -> type de message, calculée une seule fois (évite EnumMeta.__getitem__)
+_NAME_TYPE = {t.name: t for t in MessageType}
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+
+    _loads = json.loads
+
+# En-tête de trame : longueur du corps du message sur 2 octets (big-endian)
+_HEADER = struct.Struct("!H")
+
+# Taille d'un tampon de réception : de quoi contenir le plus grand message possible
+_FRAME_BUFFER_SIZE = _HEADER.size + 0xFFFF
+
+# Les messages binaires commencent par ce marqueur (les messages JSON commencent par "{")
+_BINARY_MARKER = 1
+
+
+class PlayMove(NamedTuple):
+    """Données d'un message PLAY_MOVE reçu."""
+    match_id: int
+    column: int
+
+
+class MovePlayed(NamedTuple):
+    """Données d'un message MOVE_PLAYED reçu."""
+    match_id: int
+    player: int
+    column: int
+    row: int
+    board: list
+    your_turn: bool
+
+
+def _encode_play_move(data):
+    return data["match_id"], data["column"]
+
+
+def _decode_play_move(fields):
+    return PlayMove(*fields)
+
+
+def _encode_move_played(data):
+    board = bytes(cell for row in data["board"] for cell in row)
+    return data["match_id"], data["player"], data["column"], data["row"], data["your_turn"], board
+
+
+def _decode_move_played(fields):
+    match_id, player, column, row, your_turn, board = fields
+    return MovePlayed(match_id, player, column, row,
+                      [list(board[i:i + 7]) for i in range(0, 42, 7)], bool(your_turn))
+
+
+# Messages fréquents encodés en binaire : {type: (format après marqueur et type, encodeur, décodeur)}
+_BINARY_TYPES = {
+    MessageType.PLAY_MOVE: (struct.Struct("!BBIB"), _encode_play_move, _decode_play_move),
+    MessageType.MOVE_PLAYED: (struct.Struct("!BBIBBBB42s"), _encode_move_played, _decode_move_played),
+}
+_BINARY_BY_VALUE = {t.value: codec for t, codec in _BINARY_TYPES.items()}
+
+
+def _frame(body):
+    return _HEADER.pack(len(body)) + body
+
+
+# Trames pré-encodées des messages sans données (LEAVE_QUEUE, DISCONNECT, QUEUE_INFO_REQUEST...)
+_EMPTY_FRAMES = {
+    t: _frame(_dumps({"type": t.name, "data": {}}))
+    for t in MessageType if t not in _BINARY_TYPES
+}
+
+
 def create_message(msg_type, data=None):
     """
     Crée un message formaté pour la communication.
@@ -39,16 +124,145 @@ def create_message(msg_type, data=None):
     Returns:
         bytes: Message encodé prêt à être envoyé
     """
-    if data is None:
+    if not data:
+        # Message sans données : trame calculée une fois pour toutes
+        frame = _EMPTY_FRAMES.get(msg_type)
+        if frame is not None:
+            return frame
         data = {}
 
-    message = {
-        "type": msg_type.name,
-        "data": data
-    }
+    binary = _BINARY_TYPES.get(msg_type)
+    if binary is not None:
+        # Corps binaire de taille fixe pour les coups
+        fmt, encode, _ = binary
+        body = fmt.pack(_BINARY_MARKER, msg_type.value, *encode(data))
+    else:
+        message = {
+            "type": msg_type.name,
+            "data": data
+        }
+        body = _dumps(message)
 
-    # Encode en JSON puis en bytes avec un caractère de fin de message
-    return (json.dumps(message) + "\n").encode('utf-8')
+    # Préfixe la longueur du corps pour délimiter le message
+    return _frame(body)
+
+
+class BufferPool:
+    """
+    Réserve de tampons de réception réutilisables, partagée par plusieurs FrameReader.
+
+    Destinée à un seul thread (par exemple la boucle d'événements du serveur).
+    """
+
+    def __init__(self):
+        """Crée une réserve vide : les tampons sont alloués au premier besoin."""
+        self._free = collections.deque()
+
+    def acquire(self):
+        """
+        Fournit un tampon libre, alloué si la réserve est vide.
+
+        Returns:
+            bytearray: Tampon assez grand pour contenir le plus grand message possible
+        """
+        if self._free:
+            # Le dernier tampon rendu, le plus susceptible d'être encore en cache
+            return self._free.pop()
+        return bytearray(_FRAME_BUFFER_SIZE)
+
+    def release(self, buffer):
+        """
+        Rend un tampon à la réserve.
+
+        Args:
+            buffer (bytearray): Tampon obtenu par acquire()
+        """
+        self._free.append(buffer)
+
+
+class FrameReader:
+    """Tampon de réception préalloué découpant le flux TCP en messages."""
+
+    def __init__(self, pool=None):
+        """
+        Prépare le tampon de réception.
+
+        Args:
+            pool (BufferPool, optional): Réserve de tampons partagée. Le tampon n'est alors
+                emprunté que tant qu'il reste des octets à traiter ; sinon il est alloué
+                une fois pour toutes.
+        """
+        self.pool = pool
+        self.buffer = None
+        self.view = None
+        self.end = 0  # Nombre d'octets reçus non encore traités
+        if pool is None:
+            self._use_buffer(bytearray(_FRAME_BUFFER_SIZE))
+
+    def _use_buffer(self, buffer):
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+
+    def _release_buffer(self):
+        """Rend le tampon à la réserve s'il est emprunté et vide."""
+        if self.pool is not None and self.buffer is not None and not self.end:
+            self.pool.release(self.buffer)
+            self.buffer = None
+            self.view = None
+
+    def recv_from(self, sock):
+        """
+        Reçoit des données du socket directement dans le tampon.
+
+        Args:
+            sock (socket.socket): Socket à lire
+
+        Returns:
+            bool: False si la connexion a été fermée par le pair
+        """
+        if self.buffer is None:
+            self._use_buffer(self.pool.acquire())
+
+        received = 0
+        try:
+            received = sock.recv_into(self.view[self.end:])
+            self.end += received
+        finally:
+            # Rien reçu (ou erreur) : ne pas garder le tampon emprunté
+            self._release_buffer()
+        return received > 0
+
+    def close(self):
+        """Rend le tampon à la réserve, même s'il contient un message incomplet."""
+        self.end = 0
+        self._release_buffer()
+
+    def read_frames(self):
+        """
+        Extrait les messages complets reçus.
+
+        Le début d'un éventuel message incomplet est ramené au début du tampon.
+
+        Returns:
+            list: Les corps des messages complets
+        """
+        messages = []
+        start = 0
+        end = self.end
+        while end - start >= _HEADER.size:
+            (length,) = _HEADER.unpack_from(self.buffer, start)
+            frame_end = start + _HEADER.size + length
+            if frame_end > end:
+                # Message incomplet, attendre la suite
+                break
+            messages.append(bytes(self.view[start + _HEADER.size:frame_end]))
+            start = frame_end
+        if start:
+            self.buffer[:end - start] = self.buffer[start:end]
+            self.end = end - start
+            # Plus aucun octet en attente : le tampon peut servir à un autre client
+            self._release_buffer()
+        return messages
 
 
 def parse_message(message_bytes):
@@ -56,21 +270,31 @@ def parse_message(message_bytes):
     Parse un message reçu.
 
     Args:
-        message_bytes (bytes): Message reçu
+        message_bytes (bytes): Corps du message reçu (sans l'en-tête de longueur)
 
     Returns:
         tuple: (MessageType, dict) Le type de message et les données
+            (PlayMove ou MovePlayed pour les messages binaires)
     """
     try:
-        # Décode le message
-        message_str = message_bytes.decode('utf-8').strip()
-        message = json.loads(message_str)
+        if message_bytes and message_bytes[0] == _BINARY_MARKER:
+            # Message binaire : marqueur, type puis champs de taille fixe
+            binary = _BINARY_BY_VALUE.get(message_bytes[1])
+            if binary is None:
+                return MessageType.ERROR, {"error": f"Type de message binaire inconnu: {message_bytes[1]}"}
+            fmt, _, decode = binary
+            fields = fmt.unpack(message_bytes)
+            return MessageType(fields[1]), decode(fields[2:])
+
+        # Décode le message directement depuis les bytes
+        message = _loads(message_bytes)
 
         # Extrait le type et les données
-        msg_type = MessageType[message["type"]]
-        data = message["data"]
+        msg_type = _NAME_TYPE.get(message["type"])
+        if msg_type is None:
+            return MessageType.ERROR, {"error": f"Type de message inconnu: {message['type']}"}
 
-        return msg_type, data
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        return msg_type, message["data"]
+    except (json.JSONDecodeError, struct.error, KeyError, ValueError, TypeError, IndexError) as e:
         # En cas d'erreur, retourne un message d'erreur
-        return MessageType.ERROR, {"error": str(e)}
\ No newline at end of file
+        return MessageType.ERROR, {"error": str(e)}
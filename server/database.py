@@ -2,12 +2,129 @@
 Gestion de la base de données pour le serveur de matchmaking.
 Stocke les informations sur la file d'attente, les matchs et les tours de jeu.
 """
+import contextlib
 import sqlite3
 import json
 import os
+import threading
 from datetime import datetime
 from common.protocol import GameResult
 
+try:
+    # orjson (optionnel) décode les plateaux JSON des anciennes bases bien plus vite que json
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Requêtes SQL définies une seule fois : le même texte est réutilisé à chaque appel,
+# ce qui permet au cache de requêtes préparées de sqlite3 de les retrouver (128 entrées
+# par défaut, bien plus que les requêtes de ce module)
+_SQL_CREATE_QUEUE_PLAYER_INDEX = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_queue_player ON queue (player_ip, player_port)"
+)
+_SQL_UPSERT_QUEUED_PLAYER = """
+INSERT INTO queue (player_ip, player_port, player_name, join_time) VALUES (?, ?, ?, ?)
+ON CONFLICT (player_ip, player_port) DO UPDATE SET
+    player_name = excluded.player_name,
+    join_time = excluded.join_time
+"""
+_SQL_FIND_QUEUED_PLAYER = "SELECT id FROM queue WHERE player_ip = ? AND player_port = ?"
+
+# RETURNING (SQLite >= 3.35) renvoie l'id de l'entrée insérée ou mise à jour dans la même requête
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+if _HAS_RETURNING:
+    _SQL_UPSERT_QUEUED_PLAYER += "RETURNING id\n"
+
+_SQL_DELETE_QUEUED_PLAYER = "DELETE FROM queue WHERE player_ip = ? AND player_port = ?"
+# Seules les colonnes utilisées par le matchmaking
+_SQL_GET_QUEUE = "SELECT player_ip, player_port, player_name FROM queue ORDER BY join_time LIMIT ?"
+_SQL_COUNT_QUEUE = "SELECT COUNT(*) FROM queue"
+_SQL_INSERT_MATCH = """
+INSERT INTO matches (
+    player1_ip, player1_port, player1_name,
+    player2_ip, player2_port, player2_name,
+    board, is_finished, created_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?)
+"""
+_SQL_GET_MATCH = "SELECT * FROM matches WHERE id = ?"
+_SQL_GET_ACTIVE_MATCH_BY_PLAYER = """
+SELECT * FROM matches
+WHERE is_finished = 0 AND (
+    (player1_ip = ? AND player1_port = ?) OR
+    (player2_ip = ? AND player2_port = ?)
+)
+"""
+_SQL_HAS_ACTIVE_MATCH = """
+SELECT 1 FROM matches
+WHERE is_finished = 0 AND (
+    (player1_ip = ? AND player1_port = ?) OR
+    (player2_ip = ? AND player2_port = ?)
+)
+LIMIT 1
+"""
+_SQL_UPDATE_BOARD = "UPDATE matches SET board = ? WHERE id = ?"
+_SQL_INSERT_TURN = (
+    "INSERT INTO turns (match_id, player_number, column_played, played_at) VALUES (?, ?, ?, ?)"
+)
+_SQL_GET_TURNS = "SELECT * FROM turns WHERE match_id = ? ORDER BY played_at"
+_SQL_FINISH_MATCH = "UPDATE matches SET is_finished = 1, result = ?, finished_at = ? WHERE id = ?"
+_SQL_COUNT_ACTIVE_MATCHES = "SELECT COUNT(*) FROM matches WHERE is_finished = 0"
+
+
+def _pack_board(board):
+    """
+    Encode le plateau sur 11 octets (2 bits par case, 42 cases).
+
+    Args:
+        board (list): Plateau de jeu (6 lignes de 7 cases)
+
+    Returns:
+        bytes: Plateau compact, case (row, col) aux bits 2 * (row * 7 + col)
+    """
+    value = 0
+    shift = 0
+    for row in board:
+        for cell in row:
+            value |= cell << shift
+            shift += 2
+    return value.to_bytes(11, 'little')
+
+
+def _unpack_board(blob):
+    """
+    Décode un plateau encodé par _pack_board.
+
+    Args:
+        blob (bytes): Plateau compact (ou texte JSON des anciennes bases)
+
+    Returns:
+        list: Plateau de jeu (6 lignes de 7 cases)
+    """
+    if isinstance(blob, str):
+        # Bases créées avant le format compact
+        return _json_loads(blob)
+    value = int.from_bytes(blob, 'little')
+    return [[(value >> (2 * (row * 7 + col))) & 3 for col in range(7)] for row in range(6)]
+
+
+# Plateau vide pour Puissance 4 (7 colonnes x 6 lignes)
+_EMPTY_BOARD_BLOB = bytes(11)
+
+
+def _now():
+    """
+    Renvoie l'heure actuelle au format texte stocké dans la base.
+
+    Même format que l'adaptateur datetime par défaut de sqlite3, mais la chaîne est
+    liée telle quelle, sans conversion lors de l'exécution de la requête.
+
+    Returns:
+        str: Date et heure au format ISO ("AAAA-MM-JJ HH:MM:SS.ffffff")
+    """
+    return datetime.now().isoformat(" ")
+
 
 class Database:
     """Classe gérant la base de données du serveur."""
@@ -22,19 +139,37 @@ class Database:
         # Vérifie si le fichier de base de données existe déjà
         db_exists = os.path.exists(db_path)
 
-        # Connexion à la base de données
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # Connexion à la base de données en mode autocommit : chaque écriture isolée est validée
+        # seule, les suites d'écritures passent par _transaction()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
         self.conn.row_factory = sqlite3.Row  # Pour accéder aux colonnes par nom
-        self.cursor = self.conn.cursor()
+
+        # Journal WAL : les lectures ne sont plus bloquées par les écritures et les commits
+        # ne forcent plus de synchronisation disque complète à chaque coup
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA cache_size=-20000")
+
+        # Le serveur n'utilise la connexion que depuis son thread de base de données
+        # (check_same_thread=False permet de l'ouvrir et de la fermer depuis un autre thread).
+        # Chaque méthode utilise son propre curseur (self.conn.execute) et le verrou garde
+        # les transactions indivisibles si la classe est utilisée depuis plusieurs threads
+        self.write_lock = threading.RLock()
 
         # Si la base de données n'existe pas, créer les tables
         if not db_exists:
-            self._create_tables()
+            with self._transaction():
+                self._create_tables()
+
+        # Créer les index manquants (y compris sur les bases existantes)
+        self._create_indexes()
 
     def _create_tables(self):
         """Crée les tables nécessaires dans la base de données."""
         # Table pour la file d'attente
-        self.cursor.execute('''
+        self.conn.execute('''
         CREATE TABLE IF NOT EXISTS queue (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             player_ip TEXT NOT NULL,
@@ -45,7 +180,7 @@ class Database:
         ''')
 
         # Table pour les matchs
-        self.cursor.execute('''
+        self.conn.execute('''
         CREATE TABLE IF NOT EXISTS matches (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             player1_ip TEXT NOT NULL,
@@ -54,7 +189,7 @@ class Database:
             player2_ip TEXT NOT NULL,
             player2_port INTEGER NOT NULL,
             player2_name TEXT NOT NULL,
-            board TEXT NOT NULL,
+            board BLOB NOT NULL,
             is_finished BOOLEAN NOT NULL DEFAULT 0,
             result TEXT,
             created_at TIMESTAMP NOT NULL,
@@ -63,7 +198,7 @@ class Database:
         ''')
 
         # Table pour les tours de jeu
-        self.cursor.execute('''
+        self.conn.execute('''
         CREATE TABLE IF NOT EXISTS turns (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             match_id INTEGER NOT NULL,
@@ -74,7 +209,46 @@ class Database:
         )
         ''')
 
-        self.conn.commit()
+    def _create_indexes(self):
+        """Crée les index utilisés par les recherches fréquentes."""
+        # File d'attente triée par heure d'arrivée
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_queue_jointime ON queue (join_time)")
+
+        # Un joueur (ip, port) ne peut être qu'une fois dans la file
+        try:
+            self.conn.execute(_SQL_CREATE_QUEUE_PLAYER_INDEX)
+        except sqlite3.IntegrityError:
+            # Ancienne base contenant des doublons : ne garder que la première entrée
+            self.conn.execute(
+                "DELETE FROM queue WHERE id NOT IN (SELECT MIN(id) FROM queue GROUP BY player_ip, player_port)"
+            )
+            self.conn.execute(_SQL_CREATE_QUEUE_PLAYER_INDEX)
+
+        # Matchs en cours de chaque joueur (index partiels : les matchs terminés n'y figurent pas)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_matches_p1_active ON matches (player1_ip, player1_port) "
+            "WHERE is_finished = 0"
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_matches_p2_active ON matches (player2_ip, player2_port) "
+            "WHERE is_finished = 0"
+        )
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """
+        Regroupe plusieurs écritures dans une seule transaction.
+
+        Le verrou d'écriture est pris pendant toute la transaction, annulée en cas d'erreur.
+        """
+        with self.write_lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
 
     def add_to_queue(self, player_ip, player_port, player_name):
         """
@@ -88,29 +262,16 @@ class Database:
         Returns:
             int: ID du joueur dans la file
         """
-        # Vérifie si le joueur est déjà dans la file
-        self.cursor.execute(
-            "SELECT id FROM queue WHERE player_ip = ? AND player_port = ?",
-            (player_ip, player_port)
-        )
-        existing = self.cursor.fetchone()
-
-        if existing:
-            # Si le joueur est déjà dans la file, mettre à jour son pseudo et l'heure
-            self.cursor.execute(
-                "UPDATE queue SET player_name = ?, join_time = ? WHERE id = ?",
-                (player_name, datetime.now(), existing['id'])
+        with self.write_lock:
+            # Ajouter le joueur, ou mettre à jour son pseudo et l'heure s'il est déjà dans la file
+            cur = self.conn.execute(
+                _SQL_UPSERT_QUEUED_PLAYER,
+                (player_ip, player_port, player_name, _now())
             )
-            self.conn.commit()
-            return existing['id']
-        else:
-            # Sinon, ajouter le joueur à la file
-            self.cursor.execute(
-                "INSERT INTO queue (player_ip, player_port, player_name, join_time) VALUES (?, ?, ?, ?)",
-                (player_ip, player_port, player_name, datetime.now())
-            )
-            self.conn.commit()
-            return self.cursor.lastrowid
+            if not _HAS_RETURNING:
+                cur = self.conn.execute(_SQL_FIND_QUEUED_PLAYER, (player_ip, player_port))
+            # fetchall() termine la requête : avec RETURNING, l'écriture n'est validée qu'à ce moment
+            return cur.fetchall()[0][0]
 
     def remove_from_queue(self, player_ip, player_port):
         """
@@ -123,12 +284,12 @@ class Database:
         Returns:
             bool: True si le joueur a été retiré, False sinon
         """
-        self.cursor.execute(
-            "DELETE FROM queue WHERE player_ip = ? AND player_port = ?",
-            (player_ip, player_port)
-        )
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self.write_lock:
+            cur = self.conn.execute(
+                _SQL_DELETE_QUEUED_PLAYER,
+                (player_ip, player_port)
+            )
+            return cur.rowcount > 0
 
     def get_queue(self, limit=10):
         """
@@ -138,54 +299,71 @@ class Database:
             limit (int): Nombre maximum de joueurs à récupérer
 
         Returns:
-            list: Liste des joueurs dans la file d'attente
+            list: Joueurs dans la file d'attente (lignes sqlite3.Row : player_ip, player_port,
+                player_name, accessibles par nom de colonne)
         """
-        self.cursor.execute(
-            "SELECT * FROM queue ORDER BY join_time LIMIT ?",
+        cur = self.conn.execute(
+            _SQL_GET_QUEUE,
             (limit,)
         )
-        return [dict(row) for row in self.cursor.fetchall()]
+        # Les lignes sont renvoyées telles quelles, sans copie dans des dictionnaires
+        return cur.fetchall()
+
+    def count_queue(self):
+        """
+        Compte les joueurs dans la file d'attente.
 
-    def create_match(self, player1_ip, player1_port, player1_name,
-                     player2_ip, player2_port, player2_name):
+        Returns:
+            int: Nombre de joueurs en attente
         """
-        Crée un nouveau match entre deux joueurs.
+        cur = self.conn.execute(_SQL_COUNT_QUEUE)
+        return cur.fetchone()[0]
+
+    def create_matches(self, pairs):
+        """
+        Crée plusieurs matchs en une seule transaction.
 
         Args:
-            player1_ip (str): IP du joueur 1
-            player1_port (int): Port du joueur 1
-            player1_name (str): Pseudo du joueur 1
-            player2_ip (str): IP du joueur 2
-            player2_port (int): Port du joueur 2
-            player2_name (str): Pseudo du joueur 2
+            pairs (list): Couples (joueur 1, joueur 2) de lignes issues de get_queue
 
         Returns:
-            int: ID du match créé
+            list: IDs des matchs créés, dans l'ordre des couples
         """
-        # Plateau vide pour Puissance 4 (7 colonnes x 6 lignes)
-        empty_board = [[0 for _ in range(7)] for _ in range(6)]
+        # Tous les matchs d'une même passe partagent la même date de création
+        now = _now()
+        with self._transaction():
+            return [
+                self._insert_match(player1['player_ip'], player1['player_port'], player1['player_name'],
+                                   player2['player_ip'], player2['player_port'], player2['player_name'], now)
+                for player1, player2 in pairs
+            ]
+
+    def _insert_match(self, player1_ip, player1_port, player1_name,
+                      player2_ip, player2_port, player2_name, created_at):
+        """
+        Insère un match et retire ses joueurs de la file, sans valider la transaction.
 
-        self.cursor.execute(
-            """
-            INSERT INTO matches (
-                player1_ip, player1_port, player1_name,
-                player2_ip, player2_port, player2_name,
-                board, is_finished, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, 0, ?)
-            """,
+        Args:
+            created_at (str): Date de création du match, déjà formatée par _now()
+
+        Returns:
+            int: ID du match créé
+        """
+        cur = self.conn.execute(
+            _SQL_INSERT_MATCH,
             (
                 player1_ip, player1_port, player1_name,
                 player2_ip, player2_port, player2_name,
-                json.dumps(empty_board), datetime.now()
+                _EMPTY_BOARD_BLOB, created_at
             )
         )
-        self.conn.commit()
+        match_id = cur.lastrowid
 
         # Supprimer ces joueurs de la file d'attente
-        self.remove_from_queue(player1_ip, player1_port)
-        self.remove_from_queue(player2_ip, player2_port)
+        self.conn.execute(_SQL_DELETE_QUEUED_PLAYER, (player1_ip, player1_port))
+        self.conn.execute(_SQL_DELETE_QUEUED_PLAYER, (player2_ip, player2_port))
 
-        return self.cursor.lastrowid
+        return match_id
 
     def get_match(self, match_id):
         """
@@ -197,13 +375,13 @@ class Database:
         Returns:
             dict: Informations du match
         """
-        self.cursor.execute("SELECT * FROM matches WHERE id = ?", (match_id,))
-        match = self.cursor.fetchone()
+        cur = self.conn.execute(_SQL_GET_MATCH, (match_id,))
+        match = cur.fetchone()
 
         if match:
             match_dict = dict(match)
-            # Convertir le plateau de JSON à liste Python
-            match_dict['board'] = json.loads(match_dict['board'])
+            # Convertir le plateau compact en liste Python
+            match_dict['board'] = _unpack_board(match_dict['board'])
             return match_dict
         return None
 
@@ -218,25 +396,36 @@ class Database:
         Returns:
             dict: Informations du match ou None
         """
-        self.cursor.execute(
-            """
-            SELECT * FROM matches 
-            WHERE is_finished = 0 AND (
-                (player1_ip = ? AND player1_port = ?) OR 
-                (player2_ip = ? AND player2_port = ?)
-            )
-            """,
+        cur = self.conn.execute(
+            _SQL_GET_ACTIVE_MATCH_BY_PLAYER,
             (player_ip, player_port, player_ip, player_port)
         )
-        match = self.cursor.fetchone()
+        match = cur.fetchone()
 
         if match:
             match_dict = dict(match)
-            # Convertir le plateau de JSON à liste Python
-            match_dict['board'] = json.loads(match_dict['board'])
+            # Convertir le plateau compact en liste Python
+            match_dict['board'] = _unpack_board(match_dict['board'])
             return match_dict
         return None
 
+    def has_active_match(self, player_ip, player_port):
+        """
+        Indique si un joueur a un match en cours, sans charger le match.
+
+        Args:
+            player_ip (str): Adresse IP du joueur
+            player_port (int): Port du joueur
+
+        Returns:
+            bool: True si le joueur a un match non terminé
+        """
+        cur = self.conn.execute(
+            _SQL_HAS_ACTIVE_MATCH,
+            (player_ip, player_port, player_ip, player_port)
+        )
+        return cur.fetchone() is not None
+
     def update_board(self, match_id, new_board):
         """
         Met à jour l'état du plateau de jeu.
@@ -248,12 +437,12 @@ class Database:
         Returns:
             bool: True si la mise à jour a réussi
         """
-        self.cursor.execute(
-            "UPDATE matches SET board = ? WHERE id = ?",
-            (json.dumps(new_board), match_id)
-        )
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self.write_lock:
+            cur = self.conn.execute(
+                _SQL_UPDATE_BOARD,
+                (_pack_board(new_board), match_id)
+            )
+            return cur.rowcount > 0
 
     def add_turn(self, match_id, player_number, column_played):
         """
@@ -267,12 +456,12 @@ class Database:
         Returns:
             int: ID du tour créé
         """
-        self.cursor.execute(
-            "INSERT INTO turns (match_id, player_number, column_played, played_at) VALUES (?, ?, ?, ?)",
-            (match_id, player_number, column_played, datetime.now())
-        )
-        self.conn.commit()
-        return self.cursor.lastrowid
+        with self.write_lock:
+            cur = self.conn.execute(
+                _SQL_INSERT_TURN,
+                (match_id, player_number, column_played, _now())
+            )
+            return cur.lastrowid
 
     def get_turns(self, match_id):
         """
@@ -284,11 +473,11 @@ class Database:
         Returns:
             list: Liste des tours joués
         """
-        self.cursor.execute(
-            "SELECT * FROM turns WHERE match_id = ? ORDER BY played_at",
+        cur = self.conn.execute(
+            _SQL_GET_TURNS,
             (match_id,)
         )
-        return [dict(row) for row in self.cursor.fetchall()]
+        return [dict(row) for row in cur.fetchall()]
 
     def finish_match(self, match_id, result):
         """
@@ -301,12 +490,22 @@ class Database:
         Returns:
             bool: True si la mise à jour a réussi
         """
-        self.cursor.execute(
-            "UPDATE matches SET is_finished = 1, result = ?, finished_at = ? WHERE id = ?",
-            (result.name, datetime.now(), match_id)
-        )
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self.write_lock:
+            cur = self.conn.execute(
+                _SQL_FINISH_MATCH,
+                (result.name, _now(), match_id)
+            )
+            return cur.rowcount > 0
+
+    def count_active_matches(self):
+        """
+        Compte les matchs en cours.
+
+        Returns:
+            int: Nombre de matchs non terminés
+        """
+        cur = self.conn.execute(_SQL_COUNT_ACTIVE_MATCHES)
+        return cur.fetchone()[0]
 
     def close(self):
         """Ferme la connexion à la base de données."""
@@ -4,13 +4,38 @@ Logique du jeu Puissance 4 pour le serveur de matchmaking.
 from common.protocol import GameResult
 
 
+# Représentation en bitboards : un entier par joueur, 7 bits par colonne
+# (6 lignes de bas en haut + 1 bit de garde pour que les décalages ne débordent pas
+# d'une colonne à l'autre). La case (row, col) correspond au bit col * 7 + (5 - row).
+_DIRECTION_SHIFTS = (1, 7, 6, 8)  # Vertical, horizontal et les deux diagonales
+
+
+def _has_four(bits):
+    """
+    Indique si un bitboard contient quatre pièces alignées.
+
+    Args:
+        bits (int): Bitboard d'un joueur
+
+    Returns:
+        bool: True si quatre pièces sont alignées
+    """
+    for shift in _DIRECTION_SHIFTS:
+        pairs = bits & (bits >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
 class ConnectFourGame:
     """Implémentation de la logique du jeu Puissance 4."""
 
     def __init__(self):
         """Initialise un nouveau jeu de Puissance 4."""
-        # Plateau 7 colonnes x 6 lignes (vide = 0, joueur 1 = 1, joueur 2 = 2)
-        self.board = [[0 for _ in range(7)] for _ in range(6)]
+        # Plateau 7 colonnes x 6 lignes : un bitboard par joueur et la hauteur de chaque colonne
+        self.bitboards = [0, 0]
+        self.heights = [0] * 7
+        self.pieces_count = 0  # Le plateau est plein (match nul) à 42 pièces
         # Le joueur 1 commence
         self.current_player = 1
         self.is_game_over = False
@@ -21,12 +46,21 @@ class ConnectFourGame:
         Charge un plateau existant.
 
         Args:
-            board (list): Le plateau à charger
+            board (list): Le plateau à charger (vide = 0, joueur 1 = 1, joueur 2 = 2)
         """
-        self.board = board
+        bitboards = [0, 0]
+        heights = [0] * 7
+        for row, cells in enumerate(board):
+            for col, cell in enumerate(cells):
+                if cell:
+                    bitboards[cell - 1] |= 1 << (col * 7 + 5 - row)
+                    heights[col] += 1
+        self.bitboards = bitboards
+        self.heights = heights
+        self.pieces_count = sum(heights)
+
         # Détermine le joueur actuel en fonction du nombre de pièces
-        pieces_count = sum(row.count(1) for row in board) + sum(row.count(2) for row in board)
-        self.current_player = 1 if pieces_count % 2 == 0 else 2
+        self.current_player = 1 if self.pieces_count % 2 == 0 else 2
         # Vérifie si le jeu est terminé
         self.check_game_over()
 
@@ -40,12 +74,8 @@ class ConnectFourGame:
         Returns:
             bool: True si le mouvement est valide
         """
-        # Vérifier si la colonne est dans les limites
-        if not 0 <= column < 7:
-            return False
-
-        # Vérifier si la colonne n'est pas pleine
-        return self.board[0][column] == 0
+        # Vérifier si la colonne est dans les limites et n'est pas pleine
+        return 0 <= column < 7 and self.heights[column] < 6
 
     def make_move(self, column, player=None):
         """
@@ -67,22 +97,24 @@ class ConnectFourGame:
         if not self.is_valid_move(column):
             return False, -1
 
-        # Trouver la ligne la plus basse disponible dans la colonne
-        row = 5
-        while row >= 0 and self.board[row][column] != 0:
-            row -= 1
+        # Placer la pièce au-dessus de la colonne
+        height = self.heights[column]
+        self.heights[column] = height + 1
+        self.bitboards[player - 1] |= 1 << (column * 7 + height)
+        self.pieces_count += 1
 
-        # Placer la pièce
-        self.board[row][column] = player
-
-        # Vérifier si le jeu est terminé
-        self.check_game_over()
-
-        # Changer de joueur
-        if not self.is_game_over:
+        # Seul le joueur qui vient de jouer peut avoir gagné
+        if _has_four(self.bitboards[player - 1]):
+            self.is_game_over = True
+            self.result = GameResult.PLAYER1_WIN if player == 1 else GameResult.PLAYER2_WIN
+        elif self.pieces_count == 42:
+            self.is_game_over = True
+            self.result = GameResult.DRAW
+        else:
+            # Changer de joueur
             self.current_player = 3 - player  # Alterne entre 1 et 2
 
-        return True, row
+        return True, 5 - height
 
     def check_game_over(self):
         """
@@ -91,48 +123,18 @@ class ConnectFourGame:
         Returns:
             bool: True si le jeu est terminé
         """
-        # Vérifier une victoire horizontale
-        for row in range(6):
-            for col in range(4):
-                if (self.board[row][col] != 0 and
-                        self.board[row][col] == self.board[row][col + 1] ==
-                        self.board[row][col + 2] == self.board[row][col + 3]):
-                    self.is_game_over = True
-                    self.result = GameResult.PLAYER1_WIN if self.board[row][col] == 1 else GameResult.PLAYER2_WIN
-                    return True
-
-        # Vérifier une victoire verticale
-        for row in range(3):
-            for col in range(7):
-                if (self.board[row][col] != 0 and
-                        self.board[row][col] == self.board[row + 1][col] ==
-                        self.board[row + 2][col] == self.board[row + 3][col]):
-                    self.is_game_over = True
-                    self.result = GameResult.PLAYER1_WIN if self.board[row][col] == 1 else GameResult.PLAYER2_WIN
-                    return True
-
-        # Vérifier une victoire diagonale (bas gauche vers haut droit)
-        for row in range(3, 6):
-            for col in range(4):
-                if (self.board[row][col] != 0 and
-                        self.board[row][col] == self.board[row - 1][col + 1] ==
-                        self.board[row - 2][col + 2] == self.board[row - 3][col + 3]):
-                    self.is_game_over = True
-                    self.result = GameResult.PLAYER1_WIN if self.board[row][col] == 1 else GameResult.PLAYER2_WIN
-                    return True
-
-        # Vérifier une victoire diagonale (haut gauche vers bas droit)
-        for row in range(3):
-            for col in range(4):
-                if (self.board[row][col] != 0 and
-                        self.board[row][col] == self.board[row + 1][col + 1] ==
-                        self.board[row + 2][col + 2] == self.board[row + 3][col + 3]):
-                    self.is_game_over = True
-                    self.result = GameResult.PLAYER1_WIN if self.board[row][col] == 1 else GameResult.PLAYER2_WIN
-                    return True
+        # Vérifier une victoire (4 décalages et ET binaires par joueur)
+        if _has_four(self.bitboards[0]):
+            self.is_game_over = True
+            self.result = GameResult.PLAYER1_WIN
+            return True
+        if _has_four(self.bitboards[1]):
+            self.is_game_over = True
+            self.result = GameResult.PLAYER2_WIN
+            return True
 
         # Vérifier un match nul (plateau plein)
-        if all(self.board[0][col] != 0 for col in range(7)):
+        if self.pieces_count == 42:
             self.is_game_over = True
             self.result = GameResult.DRAW
             return True
@@ -144,9 +146,17 @@ class ConnectFourGame:
         Renvoie le plateau actuel.
 
         Returns:
-            list: Le plateau de jeu
+            list: Le plateau de jeu (6 lignes de 7 cases)
         """
-        return self.board
+        player1, player2 = self.bitboards
+        board = []
+        for row in range(6):
+            offset = 5 - row
+            board.append([
+                1 if (player1 >> (col * 7 + offset)) & 1 else 2 if (player2 >> (col * 7 + offset)) & 1 else 0
+                for col in range(7)
+            ])
+        return board
 
     def get_winner(self):
         """
@@ -155,4 +165,4 @@ class ConnectFourGame:
         Returns:
             GameResult: Le résultat du jeu
         """
-        return self.result
\ No newline at end of file
+        return self.result
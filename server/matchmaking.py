@@ -2,14 +2,18 @@
 Module de matchmaking pour le serveur.
 Gère la file d'attente et la création de matchs.
 """
-import threading
-import time
 from server.database import Database
+from server.game_logic import ConnectFourGame
 from common.protocol import GameResult
 
 
 class MatchmakingManager:
-    """Gestionnaire de matchmaking pour le serveur."""
+    """
+    Gestionnaire de matchmaking pour le serveur.
+
+    Toutes les méthodes sont appelées depuis le thread de la base de données du serveur,
+    qui exécute les traitements un par un : l'état en mémoire n'a pas besoin de verrou.
+    """
 
     def __init__(self, database, match_callback=None):
         """
@@ -21,59 +25,49 @@ class MatchmakingManager:
         """
         self.db = database
         self.match_callback = match_callback
-        self.running = False
-        self.thread = None
-        self.active_matches = {}  # {match_id: game_instance}
-
-    def start(self):
-        """Démarre le thread de vérification de la file d'attente."""
-        if not self.running:
-            self.running = True
-            self.thread = threading.Thread(target=self._check_queue_loop)
-            self.thread.daemon = True
-            self.thread.start()
-
-    def stop(self):
-        """Arrête le thread de vérification de la file d'attente."""
-        self.running = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
-
-    def _check_queue_loop(self):
-        """Boucle de vérification de la file d'attente."""
-        while self.running:
-            try:
-                self._match_players()
-            except Exception as e:
-                print(f"Erreur lors du matchmaking: {e}")
-
-            # Attendre un peu avant de vérifier à nouveau
-            time.sleep(1)
+        self.active_matches = {}  # {match_id: game_instance} des parties en cours
+        # Nombre de matchs en cours, tenu à jour ici plutôt que recompté dans la base à chaque demande
+        self.active_match_count = database.count_active_matches()
+
+    def match_pending(self):
+        """
+        Forme des matchs tant que la file d'attente contient des paires de joueurs.
+        """
+        try:
+            # Vider la file par lots tant que des matchs peuvent être formés
+            while self._match_players():
+                pass
+        except Exception as e:
+            print(f"Erreur lors du matchmaking: {e}")
 
     def _match_players(self):
         """
         Vérifie la file d'attente et crée des matchs si possible.
+
+        Returns:
+            bool: True si au moins un match a été créé
         """
         # Récupérer les joueurs en attente
         queue = self.db.get_queue(limit=10)
 
-        # S'il y a au moins 2 joueurs, créer un match
-        if len(queue) >= 2:
-            player1 = queue[0]
-            player2 = queue[1]
+        # Former des couples dans l'ordre d'arrivée (un joueur impair reste en attente)
+        pairs = list(zip(queue[0::2], queue[1::2]))
+        if not pairs:
+            return False
 
-            # Créer le match dans la base de données
-            match_id = self.db.create_match(
-                player1['player_ip'], player1['player_port'], player1['player_name'],
-                player2['player_ip'], player2['player_port'], player2['player_name']
-            )
+        # Créer tous les matchs dans la base de données en une seule transaction
+        match_ids = self.db.create_matches(pairs)
+        self.active_match_count += len(match_ids)
 
+        for match_id, (player1, player2) in zip(match_ids, pairs):
             print(f"Match créé: {match_id} entre {player1['player_name']} et {player2['player_name']}")
 
             # Appeler le callback si défini
             if self.match_callback:
                 self.match_callback(match_id, player1, player2)
 
+        return True
+
     def record_move(self, match_id, player_number, column):
         """
         Enregistre un coup joué.
@@ -86,16 +80,18 @@ class MatchmakingManager:
         Returns:
             tuple: (bool, dict) - (Succès, Informations sur le coup)
         """
-        # Récupérer le match
-        match_data = self.db.get_match(match_id)
-        if not match_data or match_data['is_finished']:
-            return False, {"error": "Match non trouvé ou terminé"}
+        # Partie en mémoire, chargée depuis la base seulement au premier coup reçu
+        game = self.active_matches.get(match_id)
+        if game is None:
+            match_data = self.db.get_match(match_id)
+            if not match_data or match_data['is_finished']:
+                return False, {"error": "Match non trouvé ou terminé"}
 
-        # Vérifier que c'est bien le tour du joueur
-        from server.game_logic import ConnectFourGame
-        game = ConnectFourGame()
-        game.load_board(match_data['board'])
+            game = ConnectFourGame()
+            game.load_board(match_data['board'])
+            self.active_matches[match_id] = game
 
+        # Vérifier que c'est bien le tour du joueur
         if game.current_player != player_number:
             return False, {"error": "Ce n'est pas votre tour"}
 
@@ -104,15 +100,25 @@ class MatchmakingManager:
         if not success:
             return False, {"error": "Coup invalide"}
 
-        # Mettre à jour le plateau dans la base de données
-        self.db.update_board(match_id, game.get_board())
+        try:
+            # Mettre à jour le plateau dans la base de données
+            board = game.get_board()
+            self.db.update_board(match_id, board)
+
+            # Enregistrer le tour
+            turn_id = self.db.add_turn(match_id, player_number, column)
 
-        # Enregistrer le tour
-        turn_id = self.db.add_turn(match_id, player_number, column)
+            # Vérifier si le jeu est terminé
+            if game.is_game_over:
+                self.db.finish_match(match_id, game.get_winner())
+        except Exception:
+            # La partie en mémoire contient un coup absent de la base : la recharger au prochain coup
+            self.active_matches.pop(match_id, None)
+            raise
 
-        # Vérifier si le jeu est terminé
         if game.is_game_over:
-            self.db.finish_match(match_id, game.get_winner())
+            del self.active_matches[match_id]
+            self.active_match_count -= 1
 
         # Retourner les informations du coup
         return True, {
@@ -120,45 +126,26 @@ class MatchmakingManager:
             "player": player_number,
             "column": column,
             "row": row,
-            "board": game.get_board(),
+            "board": board,
             "is_game_over": game.is_game_over,
             "result": game.get_winner().name if game.is_game_over else None,
             "next_player": game.current_player
         }
 
-    def get_match_status(self, match_id):
+    def forget_player(self, player_ip, player_port):
         """
-        Récupère le statut actuel d'un match.
+        Libère la partie en mémoire d'un joueur qui s'est déconnecté.
 
-        Args:
-            match_id (int): ID du match
+        Une partie abandonnée n'est jamais terminée : sans cela, elle resterait en mémoire
+        jusqu'à l'arrêt du serveur. Elle sera rechargée depuis la base si un coup arrive encore.
 
-        Returns:
-            dict: Statut du match
+        Args:
+            player_ip (str): Adresse IP du joueur
+            player_port (int): Port du joueur
         """
-        match_data = self.db.get_match(match_id)
-        if not match_data:
-            return {"error": "Match non trouvé"}
+        if not self.active_matches:
+            return
 
-        # Charger le jeu pour déterminer le joueur actuel et l'état de la partie
-        from server.game_logic import ConnectFourGame
-        game = ConnectFourGame()
-        game.load_board(match_data['board'])
-
-        return {
-            "match_id": match_id,
-            "board": game.get_board(),
-            "current_player": game.current_player,
-            "is_game_over": match_data['is_finished'] == 1,
-            "result": match_data['result'] if match_data['is_finished'] == 1 else None,
-            "player1": {
-                "ip": match_data['player1_ip'],
-                "port": match_data['player1_port'],
-                "name": match_data['player1_name']
-            },
-            "player2": {
-                "ip": match_data['player2_ip'],
-                "port": match_data['player2_port'],
-                "name": match_data['player2_name']
-            }
-        }
\ No newline at end of file
+        match = self.db.get_active_match_by_player(player_ip, player_port)
+        if match:
+            self.active_matches.pop(match['id'], None)
@@ -2,13 +2,54 @@
 Serveur principal pour le jeu Puissance 4.
 Gère les connexions clients et les messages.
 """
+import collections
+import functools
+import heapq
+import itertools
+import queue
+import selectors
 import socket
 import threading
 import time
-import select
 from server.database import Database
 from server.matchmaking import MatchmakingManager
-from common.protocol import MessageType, create_message, parse_message
+from common.protocol import (MessageType, create_message, parse_message, FrameReader, BufferPool,
+                             PlayMove)
+
+# Envoi groupé de plusieurs messages en un seul appel système (absent sous Windows)
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+_MAX_SEND_BUFFERS = 512  # Reste sous la limite IOV_MAX du système
+
+# Délai entre MATCH_FOUND et GAME_START, pour laisser aux clients le temps d'afficher le match trouvé
+_GAME_START_DELAY = 1.0
+
+# Réponse aux types de message non gérés, encodée une seule fois
+_UNHANDLED_TYPE_ERROR = create_message(MessageType.ERROR, {"error": "Type de message non géré"})
+
+
+class Client:
+    """État d'une connexion client gérée par la boucle d'événements."""
+
+    __slots__ = ("socket", "address", "name", "reader", "out", "writing", "handler")
+
+    def __init__(self, client_socket, client_address, reader, handler):
+        """
+        Initialise l'état d'un client qui vient de se connecter.
+
+        Args:
+            client_socket (socket): Socket du client
+            client_address (tuple): Adresse du client (ip, port)
+            reader (FrameReader): Tampon de réception du client
+            handler (callable): Fonction appelée par la boucle quand le socket est prêt
+        """
+        self.socket = client_socket
+        self.address = client_address
+        self.name = f"Guest_{client_address[0]}_{client_address[1]}"
+        self.reader = reader
+        self.out = collections.deque()  # Messages encodés en attente d'envoi
+        self.writing = False  # EVENT_WRITE surveillé (le socket était plein)
+        self.handler = handler
+
 
 class GameServer:
     """Serveur de jeu pour Puissance 4."""
@@ -24,10 +65,32 @@ class GameServer:
         self.host = host
         self.port = port
         self.server_socket = None
-        self.clients = {}  # {(ip, port): {"socket": socket, "name": name}}
+        self.clients = {}  # {(ip, port): Client}
         self.running = False
         self.db = Database()
         self.matchmaking = MatchmakingManager(self.db, self._on_match_created)
+        # Gestionnaire de chaque type de message accepté d'un client : (client_address, data)
+        self._handlers = {
+            MessageType.JOIN_QUEUE: self._handle_join_queue,
+            MessageType.LEAVE_QUEUE: self._handle_leave_queue,
+            MessageType.PLAY_MOVE: self._handle_play_move,
+            MessageType.QUEUE_INFO_REQUEST: self._handle_queue_info_request,
+            MessageType.DISCONNECT: self._handle_disconnect,
+        }
+        self.selector = None
+        self._loop_thread = None  # Thread exécutant la boucle d'événements
+        self._calls = collections.deque()  # Appels transmis à la boucle par les autres threads
+        self._calls_lock = threading.Lock()
+        self._wakeup_r = None
+        self._wakeup_w = None
+        self._pending_flush = set()  # Clients ayant des messages à envoyer à la fin du passage
+        self.buffer_pool = BufferPool()  # Tampons de réception partagés par les clients
+        self._timers = []  # Tas de (échéance, numéro, callback, args) exécutés par la boucle
+        self._timer_seq = itertools.count()  # Départage les échéances égales
+        # Les traitements accédant à la base sont exécutés dans l'ordre par un thread dédié,
+        # pour que la boucle d'événements ne soit jamais bloquée par SQLite
+        self._db_queue = queue.SimpleQueue()
+        self._db_thread = None
 
     def start(self):
         """Démarre le serveur."""
@@ -36,37 +99,73 @@ class GameServer:
 
         try:
             self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(10)
+            # File d'acceptation aussi longue que le système le permet (rafales de connexions)
+            self.server_socket.listen(socket.SOMAXCONN)
             self.server_socket.setblocking(False)
 
+            # Une seule boucle d'événements pour les connexions et tous les clients
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.server_socket, selectors.EVENT_READ, self._on_accept)
+
+            # Paire de sockets permettant aux autres threads de réveiller la boucle
+            self._wakeup_r, self._wakeup_w = socket.socketpair()
+            self._wakeup_r.setblocking(False)
+            self.selector.register(self._wakeup_r, selectors.EVENT_READ, self._on_wakeup)
+
             print(f"Serveur démarré sur {self.host}:{self.port}")
 
             self.running = True
-            self.matchmaking.start()
-
-            # Thread principal pour accepter les connexions
-            accept_thread = threading.Thread(target=self._accept_connections)
-            accept_thread.daemon = True
-            accept_thread.start()
+            self._loop_thread = threading.current_thread()
+            self._db_thread = threading.Thread(target=self._db_worker_loop)
+            self._db_thread.daemon = True
+            self._db_thread.start()
 
-            # Attendre que le thread se termine
             while self.running:
-                time.sleep(0.1)
+                # Attendre un événement réseau, un réveil ou la prochaine échéance
+                timeout = None
+                if self._timers:
+                    timeout = max(0.0, self._timers[0][0] - time.monotonic())
+                for key, mask in self.selector.select(timeout):
+                    try:
+                        key.data(mask)
+                    except Exception as e:
+                        # Une erreur sur une connexion ne doit pas arrêter la boucle
+                        print(f"Erreur dans la boucle d'événements: {e}")
+
+                # Exécuter les appels différés arrivés à échéance
+                if self._timers:
+                    self._run_timers()
+
+                # Envoyer en une fois, par client, les messages produits pendant ce passage
+                if self._pending_flush:
+                    self._flush_pending()
 
         except Exception as e:
             print(f"Erreur au démarrage du serveur: {e}")
         finally:
+            self._loop_thread = None
             self.stop()
 
     def stop(self):
         """Arrête le serveur."""
         self.running = False
-        self.matchmaking.stop()
+
+        if self._loop_thread is not None and threading.current_thread() is not self._loop_thread:
+            # La boucle d'événements fermera les connexions en se terminant
+            self._wake()
+            return
+
+        # Laisser le thread de la base terminer les traitements en attente : il doit être
+        # arrêté avant la fermeture de la connexion SQLite qu'il utilise
+        if self._db_thread:
+            self._db_queue.put(None)
+            self._db_thread.join()
+            self._db_thread = None
 
         # Fermer toutes les connexions client
         for client_info in self.clients.values():
             try:
-                client_info["socket"].close()
+                client_info.socket.close()
             except:
                 pass
 
@@ -77,106 +176,276 @@ class GameServer:
             except:
                 pass
 
+        # Fermer la boucle d'événements
+        if self.selector:
+            self.selector.close()
+        for sock in (self._wakeup_r, self._wakeup_w):
+            if sock:
+                sock.close()
+
         # Fermer la base de données
         self.db.close()
 
         print("Serveur arrêté")
 
-    def _accept_connections(self):
-        """Thread pour accepter les connexions entrantes."""
-        while self.running:
+    def _wake(self):
+        """Réveille la boucle d'événements bloquée dans select()."""
+        try:
+            self._wakeup_w.send(b"\0")
+        except (AttributeError, OSError):
+            # Boucle non démarrée ou déjà terminée
+            pass
+
+    def _call_soon(self, callback, *args):
+        """
+        Planifie l'appel d'une fonction dans le thread de la boucle d'événements.
+
+        Args:
+            callback (callable): Fonction à appeler
+            *args: Arguments de la fonction
+        """
+        with self._calls_lock:
+            wake = not self._calls
+            self._calls.append((callback, args))
+        if wake:
+            self._wake()
+
+    def _db_call(self, callback, *args):
+        """
+        Planifie l'appel d'une fonction dans le thread de la base de données.
+
+        Les appels sont exécutés un par un, dans l'ordre où ils ont été planifiés.
+
+        Args:
+            callback (callable): Fonction à appeler
+            *args: Arguments de la fonction
+        """
+        self._db_queue.put((callback, args))
+
+    def _db_worker_loop(self):
+        """Boucle du thread exécutant les traitements qui accèdent à la base de données."""
+        while True:
+            task = self._db_queue.get()
+            if task is None:
+                break
+
+            callback, args = task
             try:
-                # Utiliser select pour accepter des connexions sans bloquer
-                readable, _, _ = select.select([self.server_socket], [], [], 0.5)
+                callback(*args)
+            except Exception as e:
+                print(f"Erreur lors du traitement d'une requête: {e}")
+
+    def _call_later(self, delay, callback, *args):
+        """
+        Planifie l'appel d'une fonction dans la boucle d'événements après un délai.
+
+        Peut être appelé depuis n'importe quel thread.
 
-                if self.server_socket in readable:
-                    client_socket, client_address = self.server_socket.accept()
-                    client_socket.setblocking(True)  # Mettre le socket client en mode bloquant
+        Args:
+            delay (float): Délai en secondes
+            callback (callable): Fonction à appeler
+            *args: Arguments de la fonction
+        """
+        deadline = time.monotonic() + delay
+        if threading.current_thread() is self._loop_thread:
+            self._add_timer(deadline, callback, args)
+        else:
+            self._call_soon(self._add_timer, deadline, callback, args)
 
-                    # Créer un thread pour gérer ce client
-                    client_thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client_socket, client_address)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
+    def _add_timer(self, deadline, callback, args):
+        """Ajoute un appel différé au tas des échéances (thread de la boucle uniquement)."""
+        heapq.heappush(self._timers, (deadline, next(self._timer_seq), callback, args))
 
-                    print(f"Nouvelle connexion de {client_address[0]}:{client_address[1]}")
+    def _run_timers(self):
+        """Exécute les appels différés dont l'échéance est passée."""
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, callback, args = heapq.heappop(self._timers)
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Erreur lors d'un appel différé: {e}")
 
+    def _on_wakeup(self, mask):
+        """
+        Exécute les appels transmis par les autres threads.
+
+        Args:
+            mask (int): Événements prêts sur la paire de réveil
+        """
+        try:
+            self._wakeup_r.recv(4096)
+        except BlockingIOError:
+            pass
+
+        with self._calls_lock:
+            calls = list(self._calls)
+            self._calls.clear()
+        for callback, args in calls:
+            try:
+                callback(*args)
             except Exception as e:
-                if self.running:  # Ignorer les erreurs pendant l'arrêt
-                    print(f"Erreur lors de l'acceptation des connexions: {e}")
-                    time.sleep(1)  # Attendre un peu avant de réessayer
+                print(f"Erreur lors d'un appel transmis à la boucle: {e}")
+
+    def _on_accept(self, mask):
+        """
+        Accepte toutes les connexions en attente.
+
+        Args:
+            mask (int): Événements prêts sur le socket serveur
+        """
+        # Vider la file des connexions en une fois plutôt qu'un accept() par passage dans select()
+        while True:
+            try:
+                client_socket, client_address = self.server_socket.accept()
+            except BlockingIOError:
+                return
+            except OSError as e:
+                print(f"Erreur lors de l'acceptation des connexions: {e}")
+                return
 
-    def _handle_client(self, client_socket, client_address):
+            self._register_client(client_socket, client_address)
+
+    def _register_client(self, client_socket, client_address):
         """
-        Gère la communication avec un client.
+        Enregistre un client qui vient de se connecter.
 
         Args:
             client_socket (socket): Socket du client
             client_address (tuple): Adresse du client (ip, port)
         """
+        handler = functools.partial(self._on_client_event, client_address)
+        try:
+            client_socket.setblocking(False)
+            # Envoyer les messages immédiatement, sans attendre l'algorithme de Nagle
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Détecter les clients disparus sans fermeture de connexion
+            client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            self.selector.register(client_socket, selectors.EVENT_READ, handler)
+        except OSError as e:
+            # Connexion déjà réinitialisée par le client : seule celle-ci est abandonnée
+            print(f"Erreur lors de l'enregistrement de {client_address[0]}:{client_address[1]}: {e}")
+            client_socket.close()
+            return
+
         # Enregistrer le client
-        self.clients[client_address] = {
-            "socket": client_socket,
-            "name": f"Guest_{client_address[0]}_{client_address[1]}"
-        }
+        self.clients[client_address] = Client(client_socket, client_address,
+                                              FrameReader(self.buffer_pool), handler)
 
-        # Configurer le socket en mode bloquant avec timeout
-        client_socket.setblocking(True)
-        client_socket.settimeout(0.5)  # Timeout de 500ms
+        print(f"Nouvelle connexion de {client_address[0]}:{client_address[1]}")
+
+    def _on_client_event(self, client_address, mask):
+        """
+        Gère la communication avec un client prêt en lecture ou en écriture.
 
-        buffer = b""
+        Args:
+            client_address (tuple): Adresse du client (ip, port)
+            mask (int): Événements prêts sur le socket du client
+        """
+        client = self.clients.get(client_address)
+        if client is None:
+            return
 
         try:
-            while self.running:
+            if mask & selectors.EVENT_WRITE:
+                self._flush(client)
+
+            if mask & selectors.EVENT_READ:
+                # Recevoir des données directement dans le tampon
                 try:
-                    # Recevoir des données
-                    data = client_socket.recv(4096)
-                    if not data:
+                    if not client.reader.recv_from(client.socket):
                         # Connexion fermée par le client
-                        break
+                        self._close_client(client_address)
+                        return
+                except BlockingIOError:
+                    return
 
-                    buffer += data
+                # Traiter tous les messages complets dans le tampon
+                for message_bytes in client.reader.read_frames():
+                    # Traiter le message
+                    self._process_message(message_bytes, client_address)
 
-                    # Traiter tous les messages complets dans le buffer
-                    while b"\n" in buffer:
-                        message_bytes, buffer = buffer.split(b"\n", 1)
+        except Exception as e:
+            print(f"Erreur lors de la communication avec {client_address}: {e}")
+            self._close_client(client_address)
 
-                        # Traiter le message
-                        self._process_message(message_bytes, client_address)
+    def _flush(self, client):
+        """
+        Envoie autant de données en attente que le socket du client l'accepte.
 
-                except socket.timeout:
-                    # Ignorer les timeouts, c'est normal
-                    continue
-                except socket.error as e:
-                    if hasattr(e, 'errno') and e.errno == 10035:  # WSAEWOULDBLOCK
-                        # Opération non bloquante qui n'a pas pu être complétée immédiatement
-                        # C'est normal, continuer
-                        continue
-                    else:
-                        # Autre erreur socket
-                        raise
+        Args:
+            client (Client): Client dont les données sont à envoyer
+        """
+        out = client.out
+        try:
+            if _HAS_SENDMSG:
+                # Écriture groupée : les messages sont envoyés sans être concaténés
+                sent = client.socket.sendmsg(list(itertools.islice(out, _MAX_SEND_BUFFERS)))
+            else:
+                sent = client.socket.send(b"".join(out))
+        except BlockingIOError:
+            sent = 0
+
+        # Retirer les messages envoyés (le dernier peut ne l'être qu'en partie)
+        while sent:
+            message = out[0]
+            if sent < len(message):
+                out[0] = message[sent:]
+                break
+            sent -= len(message)
+            out.popleft()
+
+        # Surveiller l'écriture uniquement tant que le socket n'accepte pas tout
+        writing = bool(out)
+        if writing != client.writing:
+            client.writing = writing
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if writing else 0)
+            self.selector.modify(client.socket, events, client.handler)
+
+    def _flush_pending(self):
+        """Envoie les messages mis en attente pendant le passage de la boucle d'événements."""
+        pending = self._pending_flush
+        self._pending_flush = set()
+        for client_address in pending:
+            client = self.clients.get(client_address)
+            if client is None or not client.out:
+                continue
+            try:
+                self._flush(client)
+            except OSError as e:
+                print(f"Erreur lors de l'envoi d'un message à {client_address}: {e}")
+                self._close_client(client_address)
 
-        except Exception as e:
-            print(f"Erreur lors de la communication avec {client_address}: {e}")
+    def _close_client(self, client_address):
+        """
+        Déconnecte un client.
 
-        finally:
-            # Déconnecter le client
-            print(f"Client déconnecté: {client_address[0]}:{client_address[1]}")
+        Args:
+            client_address (tuple): Adresse du client (ip, port)
+        """
+        client = self.clients.pop(client_address, None)
+        if client is None:
+            return
 
-            # Retirer le client de la file d'attente s'il y est
-            self.db.remove_from_queue(client_address[0], client_address[1])
+        print(f"Client déconnecté: {client_address[0]}:{client_address[1]}")
 
-            # Fermer le socket
-            try:
-                client_socket.close()
-            except:
-                pass
+        # Retirer le client de la file d'attente s'il y est
+        self._db_call(self.db.remove_from_queue, client_address[0], client_address[1])
+        # Libérer la partie en mémoire du client s'il en jouait une
+        self._db_call(self.matchmaking.forget_player, client_address[0], client_address[1])
 
-            # Supprimer le client de la liste
-            if client_address in self.clients:
-                del self.clients[client_address]
+        # Fermer le socket
+        try:
+            self.selector.unregister(client.socket)
+        except (KeyError, ValueError):
+            pass
+        try:
+            client.socket.close()
+        except:
+            pass
+
+        # Rendre le tampon de réception (un message incomplet est abandonné)
+        client.reader.close()
 
     def _process_message(self, message_bytes, client_address):
         """
@@ -193,43 +462,44 @@ class GameServer:
             return
 
         # Traiter selon le type de message
-        if msg_type == MessageType.JOIN_QUEUE:
-            self._handle_join_queue(client_address, data)
-
-        elif msg_type == MessageType.LEAVE_QUEUE:
-            self._handle_leave_queue(client_address)
-
-        elif msg_type == MessageType.PLAY_MOVE:
-            self._handle_play_move(client_address, data)
+        handler = self._handlers.get(msg_type)
+        if handler is None:
+            # Type de message non reconnu ou non autorisé pour un client
+            print(f"Type de message non géré: {msg_type.name}")
+            # Passer par le thread de la base, comme les autres réponses, pour garder leur ordre
+            self._db_call(self._send_frame, client_address, _UNHANDLED_TYPE_ERROR)
+            return
 
-        elif msg_type == MessageType.QUEUE_INFO_REQUEST:
-            self._handle_queue_info_request(client_address)
+        # Les réponses sont envoyées par la boucle d'événements (_send_message)
+        self._db_call(handler, client_address, data)
 
-        elif msg_type == MessageType.DISCONNECT:
-            # Le client va se déconnecter, rien à faire ici
-            pass
+    def _handle_disconnect(self, client_address, data):
+        """
+        Gère un message de type DISCONNECT.
 
-        else:
-            # Type de message non reconnu ou non autorisé pour un client
-            print(f"Type de message non géré: {msg_type.name}")
-            self._send_error(client_address, "Type de message non géré")
+        Args:
+            client_address (tuple): Adresse du client (ip, port)
+            data (dict): Données du message (inutilisées)
+        """
+        # Le client va se déconnecter, rien à faire ici
+        pass
 
-    def _handle_queue_info_request(self, client_address):
+    def _handle_queue_info_request(self, client_address, data=None):
         """
         Gère un message de type QUEUE_INFO_REQUEST.
 
         Args:
             client_address (tuple): Adresse du client (ip, port)
+            data (dict, optional): Données du message (inutilisées)
         """
         # Récupérer les informations sur la file d'attente
-        players_in_queue = len(self.db.get_queue())
+        players_in_queue = self.db.count_queue()
 
         # Compter le nombre total de joueurs connectés (incluant ceux qui ne sont pas en file d'attente)
         total_players_online = len(self.clients)
 
-        # Compter le nombre de matchs en cours
-        self.db.cursor.execute("SELECT COUNT(*) FROM matches WHERE is_finished = 0")
-        games_in_progress = self.db.cursor.fetchone()[0]
+        # Nombre de matchs en cours, tenu à jour par le matchmaking
+        games_in_progress = self.matchmaking.active_match_count
 
         # Envoyer les informations au client
         self._send_message(client_address, MessageType.QUEUE_INFO_RESPONSE, {
@@ -246,11 +516,20 @@ class GameServer:
             client_address (tuple): Adresse du client (ip, port)
             data (dict): Données du message
         """
-        player_name = data.get("name", f"Guest_{client_address[0]}_{client_address[1]}")
+        # Le client peut s'être déconnecté entre-temps
+        client = self.clients.get(client_address)
+
+        # Sans pseudo, garder le nom du client (calculé une fois à la connexion)
+        player_name = data.get("name")
+        if not player_name:
+            if client is not None:
+                player_name = client.name
+            else:
+                player_name = f"Guest_{client_address[0]}_{client_address[1]}"
 
         # Mettre à jour le nom du client
-        if client_address in self.clients:
-            self.clients[client_address]["name"] = player_name
+        if client is not None:
+            client.name = player_name
 
         # Ajouter le joueur à la file d'attente
         self.db.add_to_queue(client_address[0], client_address[1], player_name)
@@ -263,18 +542,22 @@ class GameServer:
             "message": "Vous êtes dans la file d'attente"
         })
 
-    def _handle_leave_queue(self, client_address):
+        # Former les matchs (après la confirmation, pour que MATCH_FOUND arrive ensuite)
+        self.matchmaking.match_pending()
+
+    def _handle_leave_queue(self, client_address, data=None):
         """
         Gère un message de type LEAVE_QUEUE.
 
         Args:
             client_address (tuple): Adresse du client (ip, port)
+            data (dict, optional): Données du message (inutilisées)
         """
         # Retirer le joueur de la file d'attente
         removed = self.db.remove_from_queue(client_address[0], client_address[1])
 
         # Vérifier également si le joueur est dans un match actif
-        match = self.db.get_active_match_by_player(client_address[0], client_address[1])
+        match = self.db.has_active_match(client_address[0], client_address[1])
 
         if removed:
             print(f"Joueur ({client_address[0]}:{client_address[1]}) retiré de la file d'attente")
@@ -303,10 +586,14 @@ class GameServer:
 
         Args:
             client_address (tuple): Adresse du client (ip, port)
-            data (dict): Données du message
+            data (PlayMove or dict): Données du message (binaire, ou JSON d'un ancien client)
         """
-        match_id = data.get("match_id")
-        column = data.get("column")
+        if isinstance(data, PlayMove):
+            match_id = data.match_id
+            column = data.column
+        else:
+            match_id = data.get("match_id")
+            column = data.get("column")
 
         if match_id is None or column is None:
             self._send_error(client_address, "Paramètres manquants")
@@ -387,19 +674,11 @@ class GameServer:
         player1_addr = (match_data["player1_ip"], match_data["player1_port"])
         player2_addr = (match_data["player2_ip"], match_data["player2_port"])
 
-        # Déterminer le résultat pour chaque joueur
+        # Déterminer le résultat (identique pour les deux joueurs)
         result = move_info["result"]
 
-        # Informer le joueur 1
-        self._send_message(player1_addr, MessageType.GAME_END, {
-            "match_id": move_info["match_id"],
-            "board": move_info["board"],
-            "result": result,
-            "winner": 1 if result == "PLAYER1_WIN" else (2 if result == "PLAYER2_WIN" else None)
-        })
-
-        # Informer le joueur 2
-        self._send_message(player2_addr, MessageType.GAME_END, {
+        # Informer les deux joueurs avec le même message
+        self._broadcast((player1_addr, player2_addr), MessageType.GAME_END, {
             "match_id": move_info["match_id"],
             "board": move_info["board"],
             "result": result,
@@ -412,23 +691,35 @@ class GameServer:
 
         Args:
             match_id (int): ID du match créé
-            player1 (dict): Informations sur le joueur 1
-            player2 (dict): Informations sur le joueur 2
+            player1 (sqlite3.Row): Ligne de la file d'attente du joueur 1
+            player2 (sqlite3.Row): Ligne de la file d'attente du joueur 2
         """
         # Adresses des joueurs
         player1_addr = (player1["player_ip"], player1["player_port"])
         player2_addr = (player2["player_ip"], player2["player_port"])
 
         # Informer les joueurs qu'un match a été trouvé
-        for player_addr in [player1_addr, player2_addr]:
-            self._send_message(player_addr, MessageType.MATCH_FOUND, {
-                "match_id": match_id,
-                "player1_name": player1["player_name"],
-                "player2_name": player2["player_name"]
-            })
+        self._broadcast((player1_addr, player2_addr), MessageType.MATCH_FOUND, {
+            "match_id": match_id,
+            "player1_name": player1["player_name"],
+            "player2_name": player2["player_name"]
+        })
+
+        # Démarrer la partie après un petit délai, sans bloquer le thread de la base
+        self._call_later(_GAME_START_DELAY, self._db_call,
+                         self._send_game_start, match_id, player1, player2)
 
-        # Démarrer la partie
-        time.sleep(1)  # Petit délai pour laisser le temps aux clients de traiter le message précédent
+    def _send_game_start(self, match_id, player1, player2):
+        """
+        Informe les deux joueurs du début de la partie.
+
+        Args:
+            match_id (int): ID du match
+            player1 (sqlite3.Row): Ligne de la file d'attente du joueur 1
+            player2 (sqlite3.Row): Ligne de la file d'attente du joueur 2
+        """
+        player1_addr = (player1["player_ip"], player1["player_port"])
+        player2_addr = (player2["player_ip"], player2["player_port"])
 
         match_data = self.db.get_match(match_id)
 
@@ -454,6 +745,9 @@ class GameServer:
         """
         Envoie un message à un client.
 
+        Peut être appelé depuis n'importe quel thread : l'envoi est effectué par la boucle
+        d'événements.
+
         Args:
             client_address (tuple): Adresse du client (ip, port)
             msg_type (MessageType): Type de message
@@ -462,9 +756,58 @@ class GameServer:
         if client_address in self.clients:
             try:
                 message = create_message(msg_type, data)
-                self.clients[client_address]["socket"].sendall(message)
             except Exception as e:
                 print(f"Erreur lors de l'envoi d'un message à {client_address}: {e}")
+                return
+
+            self._send_frame(client_address, message)
+
+    def _broadcast(self, client_addresses, msg_type, data):
+        """
+        Envoie le même message à plusieurs clients, en ne l'encodant qu'une fois.
+
+        Args:
+            client_addresses (tuple): Adresses des clients (ip, port)
+            msg_type (MessageType): Type de message
+            data (dict): Données du message
+        """
+        try:
+            message = create_message(msg_type, data)
+        except Exception as e:
+            print(f"Erreur lors de la création du message: {e}")
+            return
+
+        for client_address in client_addresses:
+            if client_address in self.clients:
+                self._send_frame(client_address, message)
+
+    def _send_frame(self, client_address, message):
+        """
+        Transmet un message encodé à la boucle d'événements pour envoi.
+
+        Args:
+            client_address (tuple): Adresse du client (ip, port)
+            message (bytes): Message encodé
+        """
+        if threading.current_thread() is self._loop_thread:
+            self._queue_frame(client_address, message)
+        else:
+            self._call_soon(self._queue_frame, client_address, message)
+
+    def _queue_frame(self, client_address, message):
+        """
+        Ajoute un message encodé aux données à envoyer au client à la fin du passage.
+
+        Args:
+            client_address (tuple): Adresse du client (ip, port)
+            message (bytes): Message encodé
+        """
+        client = self.clients.get(client_address)
+        if client is None:
+            return
+
+        client.out.append(message)
+        self._pending_flush.add(client_address)
 
     def _send_error(self, client_address, error_message):
         """